@@ -11,6 +11,11 @@ Run: cd workflows && uv run python examples/create_workflow_with_variables.py
 import json
 from pathlib import Path
 
+try:
+	import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+	orjson = None
+
 
 def example_1_manual_json():
 	"""Example 1: Create workflow manually with variables in JSON."""
@@ -40,8 +45,11 @@ def example_1_manual_json():
 
 	# Save to file
 	output_file = Path('/tmp/github_stars_manual.workflow.json')
-	with open(output_file, 'w') as f:
-		json.dump(workflow, f, indent=2)
+	if orjson is not None:
+		output_file.write_bytes(orjson.dumps(workflow, option=orjson.OPT_INDENT_2))
+	else:
+		with open(output_file, 'w') as f:
+			json.dump(workflow, f, indent=2)
 
 	print(f'✅ Created: {output_file}')
 	print('\n📋 Workflow structure:')
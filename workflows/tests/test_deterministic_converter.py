@@ -0,0 +1,427 @@
+"""
+Unit tests for DeterministicWorkflowConverter.
+
+Tests that recorded browser-use actions are converted into semantic workflow steps
+without any LLM involvement.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from workflow_use.healing.deterministic_converter import AgentContext, DeterministicWorkflowConverter, element_hash_hex
+
+
+class NavigateParams(BaseModel):
+	url: str
+
+
+class ClickParams(BaseModel):
+	index: int
+
+
+class DoneParams(BaseModel):
+	text: str
+
+
+class FakeAction(BaseModel):
+	"""Mirrors browser-use's ActionModel: one optional field per registered action"""
+
+	navigate: Optional[NavigateParams] = None
+	click: Optional[ClickParams] = None
+	done: Optional[DoneParams] = None
+
+
+def make_history(actions, memory='I will click [ELEMENT: "Sign in"]', url='https://example.com', interacted_element=()):
+	"""Build a minimal browser-use history item"""
+	return SimpleNamespace(
+		model_output=SimpleNamespace(current_state=SimpleNamespace(memory=memory), action=actions),
+		state=SimpleNamespace(
+			url=url, title='Example', interacted_element=list(interacted_element), to_dict=lambda: {'tabs': []}
+		),
+		metadata=SimpleNamespace(duration_seconds=2.0),
+	)
+
+
+class TestDeterministicConverter:
+	"""Test DeterministicWorkflowConverter step conversion"""
+
+	def setup_method(self):
+		"""Setup test fixture"""
+		self.converter = DeterministicWorkflowConverter()
+
+	# Test 1: Visible text wins over attributes
+	def test_target_text_prefers_node_value(self):
+		"""Test that visible text is used before any attribute"""
+		element_data = {'node_name': 'button', 'node_value': 'Submit', 'attributes': {'aria-label': 'Submit form'}}
+
+		assert self.converter._extract_target_text(element_data, {}) == 'Submit'
+
+	# Test 2: Attribute priority order
+	def test_target_text_attribute_priority(self):
+		"""Test that aria-label > placeholder > title > alt, skipping blank values"""
+		element_data = {
+			'node_name': 'input',
+			'node_value': '',
+			'attributes': {'aria-label': '   ', 'placeholder': 'Email', 'title': 'Your email', 'alt': 'icon'},
+		}
+
+		assert self.converter._extract_target_text(element_data, {}) == 'Email'
+
+		element_data['attributes'] = {'title': 'Close dialog', 'alt': 'x icon'}
+		assert self.converter._extract_target_text(element_data, {}) == 'Close dialog'
+
+	# Test 3: Input fields ignore node_value
+	def test_target_text_skips_input_node_value(self):
+		"""Test that input fields fall through to attributes instead of their current value"""
+		element_data = {'node_name': 'input', 'node_value': 'typed value', 'attributes': {'placeholder': 'Search'}}
+
+		assert self.converter._extract_target_text(element_data, {}) == 'Search'
+
+	# Test 4: No element data
+	def test_target_text_without_element_data(self):
+		"""Test fallback when no element data is available"""
+		assert self.converter._extract_target_text(None, {'text': 'hello'}) == 'hello'
+		assert self.converter._extract_target_text(None, {}) == 'element'
+
+	# Test 5: Element hashes are stable short identifiers
+	def test_element_hash_is_stable(self):
+		"""Test that the same element always normalizes to the same 10-char hash"""
+		raw = {'tag_name': 'button', 'text': 'Submit', 'xpath': '/html/body/form/button', 'attributes': {}}
+
+		first = self.converter._normalize_element_data(raw)
+		second = self.converter._normalize_element_data(dict(raw))
+		other = self.converter._normalize_element_data({**raw, 'xpath': '/html/body/button'})
+
+		assert first['node_value'] == 'Submit'
+		assert first['element_hash'] == second['element_hash']
+		assert len(first['element_hash']) == 10
+		assert other['element_hash'] != first['element_hash']
+
+		# DOM element objects hash their tag name with browser-use's own element hash
+		element = SimpleNamespace(node_name='BUTTON', node_value='Submit', attributes={}, x_path='', element_hash=42)
+		normalized = self.converter._normalize_element_data(element)
+		assert (
+			normalized['element_hash'] == self.converter._normalize_element_data(SimpleNamespace(**vars(element)))['element_hash']
+		)
+		assert len(normalized['element_hash']) == 10
+		# Same helper HealingService uses for interacted elements
+		assert normalized['element_hash'] == element_hash_hex('button_42')
+
+	# Test 6: Full history conversion
+	def test_convert_history_to_steps(self):
+		"""Test that navigate/click actions become steps and done is skipped"""
+		history_list = SimpleNamespace(
+			history=[
+				make_history([FakeAction(navigate=NavigateParams(url='https://example.com'))]),
+				SimpleNamespace(model_output=None),
+				# Thinking-only step: no actions, and no state is touched
+				SimpleNamespace(model_output=SimpleNamespace(current_state=None, action=[]), state=None),
+				make_history([FakeAction(click=ClickParams(index=3)), FakeAction(done=DoneParams(text='ok'))]),
+			]
+		)
+
+		steps = self.converter.convert_history_to_steps(history_list)
+
+		assert [s['type'] for s in steps] == ['navigation', 'click']
+		assert steps[0]['url'] == 'https://example.com'
+		assert steps[0]['wait_time'] == 1.5
+		assert steps[1]['target_text'] == 'element'
+		assert steps[1]['agent_reasoning'] == 'I will click [ELEMENT: "Sign in"]'
+		assert steps[1]['page_context_url'] == 'https://example.com'
+
+	# Test 7: Click intent descriptions from reasoning
+	def test_semantic_description_click_intent(self):
+		"""Test that reasoning keywords pick the description suffix by precedence, not position"""
+		describe = self.converter._create_semantic_description
+
+		reasoning = 'open the press releases, then the sections menu'
+		assert describe('click', 'Click on News', reasoning, 'IR', 'News') == "Click on 'News' to access section"
+
+		# Overlapping keywords: 'news' must not swallow the 's' of 'section'
+		reasoning = 'click the newsection link'
+		assert describe('click', 'Click on News', reasoning, 'IR', 'News') == "Click on 'News' to access section"
+
+		reasoning = 'i will click the upcoming events link'
+		assert describe('click', 'Click on Events', reasoning, 'IR', 'Events') == "Click on 'Events' (Events/Webcasts)"
+
+		reasoning = 'click the link to continue'
+		assert describe('click', 'Click on Next', reasoning, 'IR', 'Next') == 'Click on Next (on IR)'
+		assert describe('click', 'Click on Next', '', None, 'Next') == 'Click on Next'
+
+	# Test 8: Action dispatch
+	def test_convert_action_dispatch(self):
+		"""Test that action names map to step types, skipped actions return None"""
+		convert = self.converter._convert_action_to_step
+
+		assert convert('go_to_url', {'url': 'https://a.com'}, None)['type'] == 'navigation'
+		assert convert('extract_content', {'query': 'prices'}, None)['goal'] == 'prices'
+		assert convert('scroll', {'down': False, 'pages': 0.5}, None)['scrollY'] == -400
+		assert convert('go_forward', {}, None, step_duration=4.0)['wait_time'] == 3.0
+		assert convert('select_dropdown_option', {'text': 'Blue'}, None)['type'] == 'click'
+		assert convert('send_keys', {'keys': 'Enter'}, None)['key'] == 'Enter'
+		assert convert('read_file', {}, None) is None
+		assert convert('totally_unknown', {}, None) is None
+
+	# Test 9: Context metadata per step type
+	def test_context_metadata_per_step_type(self):
+		"""Test which steps carry reasoning, page URL and page title"""
+		context = AgentContext.create('why', 'https://a.com', 'A')
+		convert = self.converter._convert_action_to_step
+
+		navigation = convert('navigate', {'url': 'https://b.com'}, None, context)
+		assert navigation['agent_reasoning'] == 'why'
+		assert 'page_context_url' not in navigation
+
+		scroll = convert('scroll', {}, None, context)
+		assert scroll['page_context_url'] == 'https://a.com'
+		assert 'page_context_title' not in scroll
+
+		click = convert('click', {'index': 1}, None, context)
+		assert click['page_context_title'] == 'A'
+
+	# Test 10: Anchor href fallback
+	def test_target_text_from_href(self):
+		"""Test that anchors without text use the last meaningful href segment"""
+		element_data = {'node_name': 'a', 'node_value': '', 'attributes': {'href': 'https://x.com/investors/sec-filings?y=1'}}
+		assert self.converter._extract_target_text(element_data, {}) == 'Sec Filings'
+
+		element_data['attributes'] = {'href': 'https://www.edison.com/investors/'}
+		assert self.converter._extract_target_text(element_data, {}) == 'a element'
+
+	# Test 11: Element lookup through interacted elements
+	def test_click_resolves_interacted_element(self):
+		"""Test that a click index resolves to the interacted element with that highlight_index"""
+
+		def element(index, text):
+			return SimpleNamespace(
+				highlight_index=index, node_name='BUTTON', node_value=text, attributes={}, x_path='', element_hash=index
+			)
+
+		history = make_history(
+			[FakeAction(click=ClickParams(index=3))],
+			interacted_element=[None, element(1, 'Cancel'), element(3, 'Continue'), element(3, 'Duplicate')],
+		)
+
+		steps = self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))
+
+		assert steps[0]['target_text'] == 'Continue'
+		assert steps[0]['elementHash'] == self.converter.element_hash_map[3]
+
+	# Test 12: Reasoning source selection
+	def test_reasoning_prefers_memory_then_thought(self):
+		"""Test that memory > thought > evaluation_previous_goal > str(current_state)"""
+
+		def reasoning_for(current_state):
+			history = make_history([FakeAction(navigate=NavigateParams(url='https://a.com'))])
+			history.model_output.current_state = current_state
+			return self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))[0].get('agent_reasoning')
+
+		assert reasoning_for(SimpleNamespace(memory='', thought='thinking', evaluation_previous_goal='ok')) == 'thinking'
+		assert reasoning_for(SimpleNamespace(evaluation_previous_goal='went well')) == 'went well'
+		assert reasoning_for(SimpleNamespace(memory=None)) == 'namespace(memory=None)'
+		assert reasoning_for(None) is None
+
+	# Test 13: Optional workflow validation
+	def test_create_workflow_definition_validate(self):
+		"""Test that validate=True checks the definition against WorkflowDefinitionSchema"""
+		steps = [
+			self.converter._convert_action_to_step('navigate', {'url': 'https://a.com'}, None),
+			self.converter._convert_action_to_step('extract', {'query': 'title'}, None),
+		]
+
+		workflow = self.converter.create_workflow_definition('wf', 'desc', steps, validate=True)
+		assert workflow['steps'] == steps
+
+		# Unvalidated by default, even when the workflow doesn't end with an extract step
+		self.converter.create_workflow_definition('wf', 'desc', steps[:1])
+		with pytest.raises(ValidationError):
+			self.converter.create_workflow_definition('wf', 'desc', steps[:1], validate=True)
+
+	# Test 14: State serialized once per history item
+	def test_state_serialized_once_per_history(self):
+		"""Test that several indexed actions share one history.state.to_dict() call"""
+		calls = []
+
+		def to_dict():
+			calls.append(1)
+			return {'tabs': [{'selector_map': {'1': {'tag_name': 'a', 'text': 'Docs'}, '2': {'tag_name': 'a', 'text': 'Blog'}}}]}
+
+		history = make_history([FakeAction(click=ClickParams(index=1)), FakeAction(click=ClickParams(index=2))])
+		history.state.to_dict = to_dict
+
+		steps = self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))
+
+		assert [s['target_text'] for s in steps] == ['Docs', 'Blog']
+		assert len(calls) == 1
+
+	# Test 15: Saving a workflow definition
+	def test_save_workflow_definition(self, tmp_path):
+		"""Test that a saved workflow round-trips through JSON"""
+		steps = [self.converter._convert_action_to_step('navigate', {'url': 'https://a.com'}, None)]
+		workflow = self.converter.create_workflow_definition('wf', 'Überblick', steps)
+		path = tmp_path / 'wf.workflow.json'
+
+		self.converter.save_workflow_definition(workflow, path)
+
+		assert json.loads(path.read_text(encoding='utf-8')) == workflow
+
+	# Test 16: Repeated element data is normalized once per conversion
+	def test_normalize_reuses_result_for_same_object(self):
+		"""Test that the same element object normalizes once and the cache is dropped after conversion"""
+		raw = {'tag_name': 'input', 'attributes': {'name': 'q'}}
+		self.converter.captured_element_text_map[1] = raw
+
+		first = self.converter._normalize_element_data(raw)
+		assert self.converter._normalize_element_data(raw) is first
+		assert self.converter._normalize_element_data(dict(raw)) is not first
+
+		history = make_history([FakeAction(click=ClickParams(index=1)), FakeAction(click=ClickParams(index=1))])
+		steps = self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))
+
+		assert steps[0]['elementHash'] == steps[1]['elementHash'] == first['element_hash']
+		assert not self.converter._norm_cache
+
+		# The cache is dropped even when a conversion fails part-way
+		with patch.object(DeterministicWorkflowConverter, '_convert_action_to_step', side_effect=RuntimeError('boom')):
+			with pytest.raises(RuntimeError):
+				self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))
+		assert not self.converter._norm_cache
+
+	# Test 17: Skipped actions are never dumped
+	def test_skipped_action_not_dumped(self):
+		"""Test that skipped actions are recognized from model_fields_set without model_dump()"""
+
+		class ExplodingDone(DoneParams):
+			def model_dump(self, **kwargs):
+				raise AssertionError('skipped actions should not be dumped')
+
+		action = FakeAction(done=ExplodingDone(text='ok'))
+
+		assert self.converter.parse_action(action) == ('done', {})
+		assert self.converter.convert_history_to_steps(SimpleNamespace(history=[make_history([action])])) == []
+
+	# Test 18: Element lookup through interactive_elements
+	def test_click_resolves_interactive_elements(self):
+		"""Test that interactive_elements are matched by index or highlight_index, first match winning, skipping non-dicts"""
+		state = {
+			'tabs': [
+				{
+					'selector_map': {'1': {'tag_name': 'a', 'text': 'Docs'}},
+					'interactive_elements': [
+						None,
+						'not an element',
+						{'highlight_index': 2, 'tag_name': 'button', 'text': 'Save'},
+						{'index': 2, 'tag_name': 'button', 'text': 'Later'},
+						{'index': 3, 'tag_name': 'button', 'text': 'Cancel'},
+					],
+				}
+			]
+		}
+		history = make_history([FakeAction(click=ClickParams(index=i)) for i in (1, 2, 3, 4)])
+		history.state.to_dict = lambda: state
+
+		steps = self.converter.convert_history_to_steps(SimpleNamespace(history=[history]))
+
+		assert [s['target_text'] for s in steps] == ['Docs', 'Save', 'Cancel', 'element']
+
+	# Test 19: Target text from agent reasoning
+	def test_target_text_from_reasoning(self):
+		"""Test the [ELEMENT] tags (last one wins) and free-form fallbacks in agent reasoning"""
+		element_data = {'node_name': 'input', 'node_value': '', 'attributes': {}}
+
+		def target(reasoning, action_dict=None):
+			return self.converter._extract_target_text(element_data, action_dict or {}, AgentContext.create(reasoning))
+
+		assert target('Type in [ELEMENT: "Email"], then [ELEMENT: \'Password\']') == 'Password'
+		assert target('Focus [ELEMENT: Search ] first') == 'Search'
+		assert target("Enter 'Jasmine' into the First Name field", {'text': 'Jasmine'}) == 'First Name'
+		assert target('Now type into the Last Name box') == 'Last Name'
+		assert target('I should click on the Search button') == 'Search'
+		assert target('nothing useful here') == 'input element'
+
+	# Test 20: Dynamic identifiers are generalized
+	def test_click_generalizes_dynamic_identifier(self):
+		"""Test that ID-like click targets become generic links with position/container hints"""
+		convert = self.converter._convert_action_to_step
+		element_data = {'node_name': 'a', 'node_value': 'ORD-12345', 'attributes': {}}
+
+		step = convert('click', {'index': 1}, element_data, AgentContext.create('Open the first order in the list'))
+		assert step['target_text'] == 'order id link'
+		assert step['position_hint'] == 'first'
+		assert step['container_hint'] == 'search results'
+
+		# Keywords are matched as substrings and picked by mapping order, not position ('recorder' holds 'order')
+		step = convert('click', {'index': 1}, element_data, AgentContext.create('Pick the user from the Recorder list'))
+		assert step['target_text'] == 'order id link'
+
+		step = convert('click', {'index': 1}, {**element_data, 'node_value': '00945776'}, AgentContext.create('Open it'))
+		assert step['target_text'] == 'id link'
+
+		step = convert('click', {'index': 1}, {**element_data, 'node_value': 'Ab123'}, AgentContext.create('Open the order'))
+		assert step['target_text'] == 'Ab123'
+		assert 'position_hint' not in step
+
+	# Test 21: name/id attributes
+	def test_target_text_from_name_and_id(self):
+		"""Test that readable name/id attributes are used and technical IDs are mined for a semantic part"""
+		element_data = {'node_name': 'input', 'node_value': '', 'attributes': {'name': 'email_address'}}
+		assert self.converter._extract_target_text(element_data, {}) == 'email_address'
+
+		element_data['attributes'] = {'name': 'dnn$ctr434$SQLViewPro$FirstName$txtParameter'}
+		assert self.converter._extract_target_text(element_data, {}) == 'First Name'
+
+		# More than 70% uppercase/digits reads as a generated ID (too short here to mine a semantic part)
+		element_data['attributes'] = {'id': 'Qa'}
+		assert self.converter._extract_target_text(element_data, {}) == 'Qa'
+		element_data['attributes'] = {'id': 'X9'}
+		assert self.converter._extract_target_text(element_data, {}) == 'input element'
+
+	# Test 22: Text field fallbacks in element data
+	def test_normalize_text_fields(self):
+		"""Test that the first non-blank text field wins and javascript: hrefs are never used as anchor text"""
+		normalize = self.converter._normalize_element_data
+
+		assert normalize({'tag_name': 'a', 'text': 'JavaScript:void(0)', 'innerText': ' Next '})['node_value'] == 'Next'
+		assert normalize({'tag_name': 'button', 'text': None, 'inner_text': '  ', 'textContent': 'Go'})['node_value'] == 'Go'
+		assert normalize({'tag_name': 'span', 'text': 42})['node_value'] == '42'
+		assert normalize({'tag_name': 'div'})['node_value'] == ''
+
+	# Test 23: Old flat action format
+	def test_parse_old_format_action(self):
+		"""Test that flat actions with a 'type' field parse to their type and full parameter dict"""
+
+		class OldAction(BaseModel):
+			type: str
+			index: Optional[int] = None
+			text: Optional[str] = None
+
+		assert self.converter.parse_action(OldAction(type='input_text', index=2, text='hi')) == (
+			'input_text',
+			{'type': 'input_text', 'index': 2, 'text': 'hi'},
+		)
+		assert self.converter.parse_action(OldAction(type='done', text='ok')) == ('done', {})
+
+	# Test 24: Explicitly-null action fields
+	def test_parse_action_ignores_null_fields(self):
+		"""Test that fields explicitly set to None don't shadow the real action, whatever the set iteration order"""
+		action = FakeAction.model_validate({'done': None, 'click': {'index': 3}})
+
+		assert action.model_fields_set == {'done', 'click'}
+		assert self.converter.parse_action(action) == ('click', {'index': 3})
+
+	# Test 25: Missing attributes
+	def test_missing_attributes_hash_and_mapping(self):
+		"""Test that missing/None attributes keep their original hash sources and share a read-only empty mapping"""
+		missing = self.converter._normalize_element_data({'tag_name': 'div'})
+		none = self.converter._normalize_element_data({'tag_name': 'div', 'attributes': None})
+
+		assert missing['element_hash'] == element_hash_hex('div_{}')
+		assert none['element_hash'] == element_hash_hex('div_None')
+		assert missing['attributes'] == none['attributes'] == {}
+		with pytest.raises(TypeError):
+			missing['attributes']['id'] = 'x'
@@ -5,9 +5,10 @@ Tests that ElementFinder correctly searches browser-use's DOM state using semant
 and returns element indices (not Playwright element handles).
 """
 
+import logging
 from unittest.mock import AsyncMock, Mock
 
-from workflow_use.workflow.element_finder import ElementFinder
+from workflow_use.workflow.element_finder import _HAS_TEXT, ElementFinder
 
 
 class TestElementFinder:
@@ -328,3 +329,200 @@ if __name__ == '__main__':
 	print(f'{"=" * 80}\n')
 
 	exit(0 if failed == 0 else 1)
+
+
+class TestElementFinderSelectorMap:
+	"""Test ElementFinder against browser-use's cached selector map"""
+
+	def setup_method(self):
+		"""Setup test fixture"""
+		self.finder = ElementFinder()
+
+	def _session(self, selector_map):
+		session = Mock()
+		session.get_current_page = AsyncMock(return_value=Mock())
+		session.get_selector_map = AsyncMock(return_value=selector_map)
+		return session
+
+	# Test 1: Higher-priority strategy wins even when a lower-priority match appears earlier in the map
+	async def test_strategy_priority_beats_map_order(self):
+		"""The earliest strategy decides the match, not the earliest node"""
+		session = self._session({1: {'aria_label': 'Send'}, 2: {'text': 'Submit'}})
+		strategies = [
+			{'type': 'aria_label', 'value': 'Send', 'priority': 3, 'metadata': {}},
+			{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		index, strategy_used = result
+		assert index == 2
+		assert strategy_used['type'] == 'text_exact'
+		assert [(a.strategy_type, a.success) for a in attempts] == [('text_exact', True)]
+
+	# Test 2: Failed strategies before the winner are recorded
+	async def test_failed_strategies_recorded_before_winner(self):
+		"""Strategies that match nothing are reported as failed attempts"""
+		session = self._session({1: {'text': 'Cancel'}, 2: {'aria_label': 'Send'}})
+		strategies = [
+			{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}},
+			{'type': 'aria_label', 'value': 'Send', 'priority': 3, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 2
+		assert [(a.strategy_type, a.success) for a in attempts] == [('text_exact', False), ('aria_label', True)]
+		assert attempts[0].error_message == 'No matching element found in DOM'
+
+	# Test 3: Invisible nodes are skipped
+	async def test_invisible_node_skipped(self):
+		"""A matching but invisible node is not returned"""
+		session = self._session({1: {'text': 'Submit', 'is_visible': False}, 2: {'text': 'Submit'}})
+		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
+
+		result, _ = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 2
+
+	# Test 4: No match records every strategy as failed
+	async def test_no_match(self):
+		"""All strategies fail when nothing matches"""
+		session = self._session({1: {'text': 'Cancel'}})
+		strategies = [
+			{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}},
+			{'type': 'placeholder', 'value': 'Email', 'priority': 4, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result is None
+		assert [a.success for a in attempts] == [False, False]
+
+	# Test 5: The per-state node fields and index are reused for the same map and rebuilt for a new one
+	async def test_selector_index_follows_map(self):
+		"""A refreshed selector map is indexed again instead of reusing stale results"""
+		first_map = {1: {'text': 'Submit'}}
+		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
+
+		result, _ = await self.finder.find_element_with_strategies(strategies, self._session(first_map))
+		assert result[0] == 1
+		index = self.finder._selector_index
+		node_fields, selector_index, page_mask = self.finder._get_selector_state(first_map)
+		assert selector_index is index
+		assert node_fields[1].text == 'Submit'
+
+		second_map = {7: {'text': 'Submit'}}
+		result, _ = await self.finder.find_element_with_strategies(strategies, self._session(second_map))
+		assert result[0] == 7
+		assert self.finder._selector_index is not index
+
+	# Test 6: role_text narrows by text and then checks the role
+	async def test_role_text_uses_text_candidates(self):
+		"""role_text skips text matches with the wrong role"""
+		session = self._session({1: {'text': 'Submit', 'role': 'link'}, 2: {'text': 'Submit', 'role': 'button'}})
+		strategies = [{'type': 'role_text', 'value': 'Submit', 'priority': 2, 'metadata': {'role': 'button'}}]
+
+		result, _ = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 2
+
+	# Test 7: Fuzzy matching skips texts whose length rules out the threshold
+	async def test_fuzzy_length_prefilter(self):
+		"""Candidates that are far too long or empty never match, close ones still do"""
+		session = self._session({1: {'text': ''}, 2: {'text': 'Submit your application now'}, 3: {'text': 'Submitt'}})
+		strategies = [{'type': 'text_fuzzy', 'value': 'Submit', 'priority': 7, 'metadata': {'threshold': 0.8}}]
+
+		result, _ = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 3
+		assert not self.finder._fuzzy_match('Submit', '', 0.8)
+		assert self.finder._fuzzy_match('', '', 0.8)
+
+	# Test 8: Strategies passed out of priority order are still tried by priority
+	async def test_unsorted_strategies_sorted(self):
+		"""The lowest priority number is tried first regardless of list order"""
+		session = self._session({1: {'placeholder': 'Email'}, 2: {'text': 'Email'}})
+		strategies = [
+			{'type': 'placeholder', 'value': 'Email', 'priority': 4, 'metadata': {}},
+			{'type': 'text_exact', 'value': 'Email', 'priority': 1, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 2
+		assert [a.strategy_type for a in attempts] == ['text_exact']
+
+	# Test 9: Node attributes are stripped and the role falls back to the lowercased tag name
+	async def test_node_fields_normalized(self):
+		"""Whitespace around attributes is ignored and tag names stand in for a missing role"""
+		session = self._session({1: {'text': '  Save  ', 'tag_name': 'BUTTON', 'aria_label': ' Save draft '}})
+		strategies = [
+			{'type': 'role_text', 'value': 'Save', 'priority': 2, 'metadata': {'role': 'button'}},
+			{'type': 'aria_label', 'value': 'Save draft', 'priority': 3, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 1
+		assert attempts[0].strategy_type == 'role_text'
+
+	# Test 10: Repeating a lookup on the same selector map reuses the cached result
+	async def test_match_cache_per_selector_map(self):
+		"""The second identical lookup is answered from the cache until the map changes"""
+		selector_map = {1: {'text': 'Cancel'}, 2: {'text': 'Submit'}}
+		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
+
+		first, _ = await self.finder.find_element_with_strategies(strategies, self._session(selector_map))
+		assert len(self.finder._match_cache) == 1
+		second, _ = await self.finder.find_element_with_strategies(strategies, self._session(selector_map))
+		assert first == second
+
+		refreshed = {5: {'text': 'Submit'}}
+		third, _ = await self.finder.find_element_with_strategies(strategies, self._session(refreshed))
+		assert third[0] == 5
+
+	# Test 11: Text strategies are skipped outright on a page without any text
+	async def test_text_strategies_skipped_without_page_text(self):
+		"""No node has text, so the text strategies fail and the placeholder strategy wins"""
+		session = self._session({1: {'placeholder': 'Search'}, 2: {'title': 'Help'}})
+		strategies = [
+			{'type': 'text_exact', 'value': 'Search', 'priority': 1, 'metadata': {}},
+			{'type': 'placeholder', 'value': 'Search', 'priority': 4, 'metadata': {}},
+			{'type': 'text_fuzzy', 'value': 'Search', 'priority': 7, 'metadata': {'threshold': 0.8}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 1
+		assert [(a.strategy_type, a.success) for a in attempts] == [('text_exact', False), ('placeholder', True)]
+		assert not self.finder._page_mask & _HAS_TEXT
+
+	# Test 12: Target text checks never change the validation result, whatever the log level
+	def test_validation_independent_of_log_level(self):
+		"""A failing advisory target-text check still accepts a visible node, with or without DEBUG logging"""
+		node = {'text': 'Submit', 'attributes': {'name': 42}}
+		logger = logging.getLogger('workflow_use.workflow.element_finder')
+		original_level = logger.level
+
+		try:
+			for level in (logging.DEBUG, logging.WARNING):
+				logger.setLevel(level)
+				assert self.finder._validate_element_in_map(1, node, target_text='Submit') is True
+				assert self.finder._validate_element_in_map(2, {'is_visible': False}, target_text='Submit') is False
+		finally:
+			logger.setLevel(original_level)
+
+	# Test 13: An unhashable strategy value is an index miss, not an error
+	async def test_unhashable_value_is_index_miss(self):
+		"""A list value fails its own strategy without aborting the remaining ones"""
+		session = self._session({1: {'aria_label': 'Send'}, 2: {'text': 'Submit'}})
+		strategies = [
+			{'type': 'aria_label', 'value': ['Send'], 'priority': 3, 'metadata': {}},
+			{'type': 'text_exact', 'value': 'Submit', 'priority': 4, 'metadata': {}},
+		]
+
+		result, attempts = await self.finder.find_element_with_strategies(strategies, session)
+
+		assert result[0] == 2
+		assert [(a.strategy_type, a.success) for a in attempts] == [('aria_label', False), ('text_exact', True)]
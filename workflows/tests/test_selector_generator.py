@@ -257,6 +257,79 @@ class TestSelectorGenerator:
 		assert 'text_exact' in summary, 'Summary should contain strategy type'
 		assert 'priority' in summary, 'Summary should contain priority info'
 
+	# Test 15: Identical element data reuses the cached strategies
+	def test_generate_strategies_cached(self):
+		"""Test that repeated calls for the same element return equal lists without regenerating"""
+		element_data = {'tag_name': 'button', 'text': 'Submit', 'attributes': {'aria-label': 'Send', 'title': 'Go'}}
+
+		first = self.generator.generate_strategies(element_data)
+		first.clear()  # Callers get their own list
+		second = self.generator.generate_strategies(dict(element_data))
+
+		assert second == self.generator.generate_strategies(element_data)
+		assert len(second) > 0
+		assert self.generator._cached_strategies.cache_info().hits == 2
+
+	# Test 16: Unhashable attribute values fall back to uncached generation
+	def test_generate_strategies_unhashable_attributes(self):
+		"""Test that list-valued attributes still generate strategies"""
+		element_data = {'tag_name': 'button', 'text': 'Submit', 'attributes': {'class': ['btn', 'primary']}}
+
+		strategies = self.generator.generate_strategies(element_data)
+
+		assert strategies[0].type == 'text_exact'
+		assert self.generator._cached_strategies.cache_info().currsize == 0
+
+	# Test 17: generate_strategies_dict agrees with to_dict
+	def test_dict_output(self):
+		"""Test the inline dict form matches the dataclass fields and doesn't share cached metadata"""
+		element_data = {'tag_name': 'input', 'text': '', 'attributes': {'placeholder': 'Email'}}
+
+		strategies = self.generator.generate_strategies(element_data)
+		dicts = self.generator.generate_strategies_dict(element_data)
+
+		assert dicts == [s.to_dict() for s in strategies]
+		dicts[0]['metadata']['tag'] = 'changed'
+		assert self.generator.generate_strategies(element_data)[0].metadata == {'tag': 'input'}
+
+	# Test 18: Short labels rank behind labelling attributes
+	def test_short_text_ranked_after_label_attributes(self):
+		"""Test that 1-3 character text yields to label attributes and optimized XPaths, but keeps priority 1 without them"""
+		labelled = self.generator.generate_strategies({'tag_name': 'button', 'text': 'X', 'attributes': {'aria-label': 'Close'}})
+		alt = self.generator.generate_strategies({'tag_name': 'img', 'text': 'X', 'attributes': {'alt': 'Close'}})
+		with_id = self.generator.generate_strategies(
+			{'tag_name': 'button', 'text': 'X', 'xpath': 'html/body/div[2]/button', 'attributes': {'alt': 'Close', 'id': 'close'}}
+		)
+		unlabelled = self.generator.generate_strategies({'tag_name': 'button', 'text': 'X', 'attributes': {}})
+
+		assert labelled[0].type == 'aria_label'
+		assert next(s for s in labelled if s.type == 'text_exact').priority == 7
+		# alt_text (6) must win outright rather than tie with the penalised text
+		assert alt[0].type == 'alt_text'
+		# Optimized XPaths (priority 2-6) also rank ahead of short text
+		assert [s.type for s in with_id] == ['xpath', 'alt_text']
+		assert with_id[0].metadata['optimized'] is True
+		assert unlabelled[0].type == 'text_exact'
+		assert unlabelled[0].priority == 1
+
+	# Test 19: Attribute order is part of the cache key
+	def test_first_data_attribute_drives_xpath_fallback(self):
+		"""Test that the first declared data-* attribute is used, even after the other order was cached"""
+		generator = SelectorGenerator(enable_xpath_optimization=False, max_total_strategies=10)
+		testid_first = {'tag_name': 'button', 'text': '', 'attributes': {'data-testid': 'save-btn', 'data-analytics': 'click-17'}}
+		analytics_first = {
+			'tag_name': 'button',
+			'text': '',
+			'attributes': {'data-analytics': 'click-17', 'data-testid': 'save-btn'},
+		}
+
+		def xpath(data):
+			return next(s.value for s in generator.generate_strategies(data) if s.type == 'xpath')
+
+		assert xpath(testid_first) == "//button[@data-testid='save-btn']"
+		assert xpath(analytics_first) == "//button[@data-analytics='click-17']"
+		assert generator._generate_css_selector('button', '', testid_first['attributes']) == 'button[data-testid="save-btn"]'
+
 
 if __name__ == '__main__':
 	# Run all tests
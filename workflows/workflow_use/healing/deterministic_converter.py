@@ -3,9 +3,206 @@ Deterministic converter that transforms browser-use agent history into semantic
 without relying on LLM for step creation. LLM is only used for variable identification.
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 from browser_use.agent.views import AgentHistoryList
+from pydantic import BaseModel
+
+from workflow_use.schema.views import WorkflowDefinitionSchema
+
+try:
+	import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+	orjson = None
+
+logger = logging.getLogger(__name__)
+
+# AgentBrain fields tried (in order) as the agent's reasoning for a history item
+_REASONING_ATTRS = ('memory', 'thought', 'evaluation_previous_goal')
+
+# Element data fields checked (in order) for an element's visible text
+_TEXT_FIELDS = ('text', 'inner_text', 'textContent', 'innerText', 'node_value')
+
+# High-value attributes checked (in order) when an element has no usable visible text
+_HIGH_VALUE_ATTRS = ('aria-label', 'placeholder', 'title', 'alt')
+# Identifier attributes checked (in order) after agent reasoning, if human-readable
+_NAME_ID_ATTRS = ('name', 'id')
+
+# Reasoning keywords that signal a click intent
+_CLICK_INTENT_KEYWORDS = ('click', 'select', 'choose', 'open')
+
+# Click intent keywords found in agent reasoning, scanned in a single pass.
+# Not word-anchored so plurals ("sections", "events") still match. A lookahead reports a match at every
+# position, so overlapping keywords ('newsection' holds both 'news' and 'section') are all found, like
+# the substring checks this replaces.
+_INTENT_RE = re.compile(r'(?=(section|filing|sec|news|press|event|webcast|presentation))', re.IGNORECASE)
+# Keyword -> (precedence, description suffix); lowest precedence wins when several keywords appear
+_INTENT_SUFFIXES = {
+	'section': (0, ' to access section'),
+	'filing': (1, ' (Filings section)'),
+	'sec': (1, ' (Filings section)'),
+	'news': (2, ' (News/Press Releases)'),
+	'press': (2, ' (News/Press Releases)'),
+	'event': (3, ' (Events/Webcasts)'),
+	'webcast': (3, ' (Events/Webcasts)'),
+	'presentation': (4, ' (Presentations)'),
+}
+
+# Structured [ELEMENT: "text"] tags the agent is asked to put in its reasoning
+_ELEMENT_TAG_QUOTED_RE = re.compile(r'\[ELEMENT:\s*["\']([^"\']+)["\']\]')
+_ELEMENT_TAG_BARE_RE = re.compile(r'\[ELEMENT:\s*([^\]]+)\]')
+# Free-form field/button mentions in reasoning, e.g. "into the First Name field", "click the Search button"
+_FIELD_CONTEXT_RE = re.compile(r'(?:into|in|for)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)')
+_FIELD_SIMPLE_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)')
+_BUTTON_RE = re.compile(
+	r'(?:click|tap|press)\s+(?:on\s+)?(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:button|link)', re.IGNORECASE
+)
+
+# Dynamic identifiers (IDs, codes) in click targets, each alternative requiring at least one digit to avoid
+# matching regular words: AP00945776/ABC123, 123456/00945776, and ORD-12345/user_456/TKT-9876.
+# Only the separated-code alternative is case-insensitive.
+_DYNAMIC_ID_RE = re.compile(r'^(?:[A-Z]{2,}\d{3,}|\d{3,}|(?i:[A-Z0-9]+[-_][A-Z0-9]*\d+[A-Z0-9]*))$')
+
+# camelCase word boundary, e.g. "FirstName" -> "First Name"
+_CAMELCASE_SPLIT_RE = re.compile(r'([a-z])([A-Z])')
+# Separators between the segments of technical IDs, e.g. 'dnn$ctr434$FirstName' or 'form.first_name'
+_ID_SEPARATOR_RE = re.compile(r'[._$]')
+
+# Substrings marking name/id attribute values as technical (generated) identifiers, scanned in a single pass
+_TECHNICAL_PATTERNS = ('$', 'ctl', 'ctr', 'dnn', 'aspnet', 'viewstate', '__', 'guid')
+_TECHNICAL_PATTERNS_RE = re.compile('|'.join(map(re.escape, _TECHNICAL_PATTERNS)))
+# Technical ID segments that never carry semantic meaning, e.g. the 'txtParameter' in 'dnn$ctr434$FirstName$txtParameter'
+_TECHNICAL_ID_SUFFIXES = frozenset({'txt', 'txtparameter', 'parameter', 'ctrl', 'control', 'btn', 'button', 'lbl', 'label'})
+
+# Reasoning keyword -> generic click target for dynamic identifiers, checked in order.
+# This makes workflows reusable across different records.
+_SEMANTIC_MAPPING = (
+	('license', 'license number link'),
+	('provider', 'provider id link'),
+	('order', 'order id link'),
+	('invoice', 'invoice number link'),
+	('ticket', 'ticket number link'),
+	('case', 'case number link'),
+	('patient', 'patient id link'),
+	('user', 'user id link'),
+	('customer', 'customer id link'),
+	('product', 'product code link'),
+	('transaction', 'transaction id link'),
+	('record', 'record id link'),
+)
+# All _SEMANTIC_MAPPING keywords found in reasoning in one scan. A lookahead reports a match at every
+# position, so overlapping keywords ('recorder' holds both 'record' and 'order') are all found, like
+# the substring checks this replaces; none is a prefix of another.
+_SEMANTIC_KEYWORDS_RE = re.compile('(?=(%s))' % '|'.join(keyword for keyword, _ in _SEMANTIC_MAPPING))
+# Keyword -> (precedence, generic click target); lowest precedence wins when several keywords appear
+_SEMANTIC_GENERIC = {keyword: (i, generic_name) for i, (keyword, generic_name) in enumerate(_SEMANTIC_MAPPING)}
+
+# Generic href path segments that never make a meaningful target_text
+_SKIP_HREF_TERMS = frozenset({'www.edison.com', 'edison.com', 'investors', 'www', 'com', 'http:', 'https:'})
+
+# Step description prefixes for the most common step types (single-value concatenation)
+_DESC_NAV = 'Navigate to '
+_DESC_INPUT = 'Enter text into '
+_DESC_CLICK = 'Click on '
+_DESC_KEYPRESS = 'Press '
+_DESC_KEYPRESS_SUFFIX = ' key'
+
+# Shared read-only empty attributes mapping for elements without attributes
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+# Sentinel for single-lookup presence checks on element data
+_MISSING = object()
+
+# Browser-use actions that don't translate to workflow steps
+_SKIPPED_ACTIONS = frozenset({'done', 'switch_tab', 'close_tab', 'write_file', 'replace_file', 'read_file', 'search_google'})
+
+
+def element_hash_hex(key: str) -> str:
+	"""
+	Return the 10-hex-char identifier for an element key.
+
+	Shared by the converter and HealingService so both produce the same element hashes.
+	This is a 5-byte BLAKE2b digest, not a truncated SHA-256, so the values differ from
+	hashes recorded by older versions.
+	"""
+	return hashlib.blake2b(key.encode(), digest_size=5).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _value_context_re(action_value: str) -> re.Pattern:
+	"""Compile the pattern matching an input value followed by the field it goes into, e.g. "'Jasmine' into the First Name field"."""
+	escaped_value = re.escape(action_value)
+	# Match: value (with quotes or not) + optional words + "into/in/for" + field name + "field/input"
+	return re.compile(
+		rf'["\']?{escaped_value}["\']?[^.]*?(?:into|in|for|to)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)',
+		re.IGNORECASE,
+	)
+
+
+def _is_human_readable(text: str) -> bool:
+	"""Check if text is human-readable, not a technical ID."""
+	text_lower = text.lower()
+	# Skip if contains common technical patterns
+	if _TECHNICAL_PATTERNS_RE.search(text_lower):
+		return False
+	# Skip if mostly uppercase/numbers (like GUID fragments), stopping as soon as that's certain
+	threshold = len(text) * 0.7
+	count = 0
+	for c in text:
+		if c.isupper() or c.isdigit():
+			count += 1
+			if count > threshold:
+				return False
+	return True
+
+
+def _extract_semantic_part(technical_id: str) -> str | None:
+	"""Try to extract semantic meaning from technical IDs like 'dnn$ctr434$SQLViewPro$FirstName$txtParameter'."""
+	# Look for parts that might be semantic (e.g., "FirstName", "LastName", "Search")
+	for part in reversed(_ID_SEPARATOR_RE.split(technical_id)):  # Check from end first (more specific)
+		# Skip common technical suffixes
+		if part.lower() in _TECHNICAL_ID_SUFFIXES:
+			continue
+		# Skip very short parts (likely not semantic)
+		if len(part) < 3:
+			continue
+		# Skip numeric parts
+		if part.isdigit():
+			continue
+		# Skip parts that look like prefixes (all caps)
+		if part.isupper() and len(part) < 5:
+			continue
+
+		# Found a potentially semantic part - convert camelCase to readable text
+		# E.g., "FirstName" -> "First Name"
+		readable = _CAMELCASE_SPLIT_RE.sub(r'\1 \2', part)
+		logger.debug('      ✓ Extracted semantic text from %s: "%s"', technical_id, readable)
+		return readable
+
+	return None
+
+
+class AgentContext(NamedTuple):
+	"""Agent reasoning and page context captured for a single history item"""
+
+	reasoning: Optional[str] = None
+	page_url: Optional[str] = None
+	page_title: Optional[str] = None
+	reasoning_lower: str = ''  # Lowercased once per history item for keyword checks
+
+	@classmethod
+	def create(cls, reasoning: Optional[str], page_url: Optional[str] = None, page_title: Optional[str] = None) -> 'AgentContext':
+		"""Build a context, precomputing the lowercased reasoning"""
+		return cls(reasoning, page_url, page_title, reasoning.lower() if reasoning else '')
+
+
+_EMPTY_CONTEXT = AgentContext()
 
 
 class DeterministicWorkflowConverter:
@@ -17,11 +214,45 @@ class DeterministicWorkflowConverter:
 	variable identification.
 	"""
 
+	# One converter is created per healing session; slots keep instances small and
+	# speed up the per-action map lookups
+	__slots__ = (
+		'llm',
+		'element_text_map',
+		'element_hash_map',
+		'captured_element_text_map',
+		'_hash_cache',
+		'_norm_cache',
+		'_handlers',
+	)
+
 	def __init__(self, llm=None):
 		self.llm = llm
 		self.element_text_map: Dict[str, str] = {}  # Maps element hashes to visible text
 		self.element_hash_map: Dict[int, str] = {}  # Maps element index to hash for selector population
 		self.captured_element_text_map: Dict[int, Any] = {}  # Captured during agent execution
+		self._hash_cache: Dict[str, str] = {}  # Maps '<tag>_<xpath|attributes>' keys to element hashes
+		# Maps id(raw element data) to (raw element data, normalized data) during a conversion.
+		# The raw object is kept so its id can't be reused by another object while cached.
+		self._norm_cache: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+
+		# Maps browser-use action names to step builders (see _convert_action_to_step)
+		self._handlers: Dict[str, Callable[..., Dict[str, Any]]] = {
+			'navigate': self._step_navigate,
+			'go_to_url': self._step_navigate,
+			'input': self._step_input,
+			'input_text': self._step_input,
+			'click': self._step_click,
+			'click_element': self._step_click,
+			'send_keys': self._step_send_keys,
+			'extract': self._step_extract,
+			'extract_page_content': self._step_extract,
+			'extract_content': self._step_extract,
+			'scroll': self._step_scroll,
+			'select_dropdown_option': self._step_dropdown,
+			'go_back': self._step_go_back,
+			'go_forward': self._step_go_forward,
+		}
 
 	def convert_history_to_steps(self, history_list: AgentHistoryList) -> List[Dict[str, Any]]:
 		"""
@@ -35,179 +266,220 @@ class DeterministicWorkflowConverter:
 		"""
 		steps = []
 
-		for history in history_list.history:
-			if history.model_output is None:
-				continue
+		try:
+			for history in history_list.history:
+				model_output = history.model_output
+				# Skip items without output or actions (e.g. thinking-only steps) before building any context
+				if model_output is None or not model_output.action:
+					continue
 
-			# Capture semantic context from the agent's reasoning
-			# current_state is an AgentBrain object, extract the text from it
-			current_state = getattr(history.model_output, 'current_state', None)
-			reasoning_text = None
-			if current_state:
-				# AgentBrain has various fields, extract the most relevant one
-				# Try memory first, then thought, then convert to string
-				if hasattr(current_state, 'memory') and current_state.memory:
-					reasoning_text = str(current_state.memory)
-				elif hasattr(current_state, 'thought') and current_state.thought:
-					reasoning_text = str(current_state.thought)
-				elif hasattr(current_state, 'evaluation_previous_goal') and current_state.evaluation_previous_goal:
-					reasoning_text = str(current_state.evaluation_previous_goal)
-				else:
-					reasoning_text = str(current_state)
-
-			agent_context = {
-				'reasoning': reasoning_text,
-				'page_url': getattr(history.state, 'url', None),
-				'page_title': getattr(history.state, 'title', None),
-			}
+				# Capture semantic context from the agent's reasoning
+				# current_state is an AgentBrain object, extract the text from it
+				current_state = getattr(model_output, 'current_state', None)
+				reasoning_text = None
+				if current_state:
+					# AgentBrain has various fields, extract the most relevant one
+					# Try memory first, then thought, then evaluation, then convert to string
+					reasoning_text = next(
+						(str(value) for attr in _REASONING_ATTRS if (value := getattr(current_state, attr, None))), None
+					) or str(current_state)
+
+				agent_context = AgentContext.create(
+					reasoning_text, getattr(history.state, 'url', None), getattr(history.state, 'title', None)
+				)
+
+				# Capture step duration if available
+				step_duration = None
+				if history.metadata and hasattr(history.metadata, 'duration_seconds'):
+					step_duration = history.metadata.duration_seconds
+
+				# Index interacted elements by highlight_index (box number) once per history item.
+				# Reversed so the first element with a given index wins, as in a linear scan.
+				highlight_map = {
+					index: e
+					for e in reversed(history.state.interacted_element)
+					if e is not None and (index := getattr(e, 'highlight_index', None)) is not None
+				}
+				# Serialize and index the state lazily, at most once per history item (only needed on captured-map misses)
+				get_state_index = functools.cache(functools.partial(self._index_state, history.state))
+
+				# Process each action in this history item
+				for action in model_output.action:
+					action_type, action_params = self.parse_action(action)
+					if action_type in _SKIPPED_ACTIONS:
+						logger.debug('   ❌ Skipped %s action (no step generated)', action_type)
+						continue
 
-			# Capture step duration if available
-			step_duration = None
-			if history.metadata and hasattr(history.metadata, 'duration_seconds'):
-				step_duration = history.metadata.duration_seconds
-
-			# Process each action in this history item
-			for action in history.model_output.action:
-				action_dict = action.model_dump()
-
-				# Browser-use action format: {action_type: {params}}
-				# Extract action type from dictionary keys (excluding 'type' if present)
-				action_type = None
-				action_params = {}
-
-				for key, value in action_dict.items():
-					if key != 'type' and isinstance(value, dict):
-						action_type = key
-						action_params = value
-						break
-
-				if not action_type:
-					# Fallback to old format if present
-					action_type = action_dict.get('type', '')
-					action_params = action_dict
-
-				# Debug: Log the action type and params
-				print(f'🔍 Processing action type: "{action_type}"')
-				print(f'   Action params: {action_params}')
-				reasoning = agent_context.get('reasoning')
-				if reasoning:
-					# Truncate long reasoning text
-					reasoning_preview = reasoning[:150] + '...' if len(reasoning) > 150 else reasoning
-					print(f'   🧠 Agent reasoning: {reasoning_preview}')
-
-				# Get interacted element data if available
-				element_data = self._get_element_data(history, action_params)
-
-				# Convert action to semantic step with context and duration
-				step = self._convert_action_to_step(action_type, action_params, element_data, agent_context, step_duration)
-
-				if step:
-					print(f'   ✅ Converted to step: {step.get("type")}')
-					steps.append(step)
-				else:
-					print('   ❌ Skipped (no step generated)')
-
-		print(f'\n📊 Total steps generated: {len(steps)}')
+					# %.150s truncates long reasoning inside the formatter, only when DEBUG is enabled
+					logger.debug(
+						'🔍 Processing action type: "%s" params=%s reasoning=%.150s',
+						action_type,
+						action_params,
+						agent_context.reasoning,
+					)
+
+					# Get interacted element data if available
+					element_data = self._get_element_data(action_params, get_state_index, highlight_map)
+
+					# Convert action to semantic step with context and duration
+					step = self._convert_action_to_step(action_type, action_params, element_data, agent_context, step_duration)
+
+					if step:
+						logger.debug('   ✅ Converted to step: %s', step.get('type'))
+						steps.append(step)
+					else:
+						logger.debug('   ❌ Skipped (no step generated)')
+		finally:
+			# Don't keep element data alive between conversions, even if one failed
+			self._norm_cache.clear()
+
+		logger.info('📊 Total steps generated: %d', len(steps))
 		return steps
 
-	def _get_element_data(self, history, action_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+	def parse_action(self, action: BaseModel) -> Tuple[str, Dict[str, Any]]:
+		"""
+		Split a browser-use action model into its action type and parameter dict.
+
+		Browser-use actions have the shape {action_type: {params}} with exactly one field set,
+		so only that sub-model is dumped instead of the whole action model. Skipped actions
+		are not dumped at all. Fields explicitly set to None are ignored.
+
+		Args:
+		    action: A browser-use action model (or an old-format model with a 'type' field)
+
+		Returns:
+		    Tuple of (action_type, action_params); params are {} for skipped actions
+		"""
+		for key in action.model_fields_set:
+			if key == 'type':
+				continue
+			value = getattr(action, key, None)
+			if value is None:
+				continue
+			if key in _SKIPPED_ACTIONS:
+				return key, {}
+			if isinstance(value, BaseModel):
+				return key, value.model_dump()
+			if isinstance(value, dict):
+				return key, value
+
+		# Fallback to old format if present: a flat model whose 'type' field names the action.
+		# The type is read straight off the model so skipped actions are never dumped.
+		action_type = getattr(action, 'type', None) or ''
+		if action_type in _SKIPPED_ACTIONS:
+			return action_type, {}
+		return action_type, action.model_dump()
+
+	def _index_state(self, state: Any) -> Tuple[Dict[str, Any], Dict[int, Any]]:
+		"""
+		Serialize a history state once and index its first tab's elements for O(1) lookup.
+
+		Returns:
+		    Tuple of (selector_map keyed by str(index), interactive_elements keyed by index/highlight_index)
+		"""
+		state_dict = state.to_dict()
+		logger.debug('      State dict keys: %s', state_dict.keys())
+
+		tabs = state_dict.get('tabs')
+		if not tabs:
+			return {}, {}
+		first_tab = tabs[0]
+		logger.debug('      First tab keys: %s', first_tab.keys())
+
+		selector_map = first_tab.get('selector_map') or {}
+		# First element carrying a given index wins, as in a linear scan
+		interactive_by_index: Dict[int, Any] = {}
+		for elem in first_tab.get('interactive_elements') or ():
+			# Skip malformed entries rather than losing the selector_map lookup for the whole state
+			if not isinstance(elem, dict):
+				continue
+			for key in (elem.get('index'), elem.get('highlight_index')):
+				if key is not None:
+					interactive_by_index.setdefault(key, elem)
+
+		logger.debug(
+			'      Indexed %d selector_map and %d interactive_elements entries', len(selector_map), len(interactive_by_index)
+		)
+		return selector_map, interactive_by_index
+
+	def _get_element_data(
+		self,
+		action_dict: Dict[str, Any],
+		get_state_index: Callable[[], Tuple[Dict[str, Any], Dict[int, Any]]],
+		highlight_map: Dict[int, Any],
+	) -> Optional[Dict[str, Any]]:
 		"""
 		Extract element data from the DOM using the box overlay index.
 
 		Browser-use creates overlay boxes on top of elements. The index refers to the box,
 		not the actual element. We need to look at the DOM state to find the visible text.
+		get_state_index returns the (memoized) _index_state of the history state, and
+		highlight_map maps highlight_index to the history item's interacted elements.
 		"""
 		index = action_dict.get('index')
 		if index is None:
 			return None
 
-		# Debug: Print available data in history.state
-		print(f'   🔍 Looking for element with index {index}')
+		logger.debug('   🔍 Looking for element with index %s', index)
 
 		# First, try to get from captured element map (captured during agent execution)
 		if index in self.captured_element_text_map:
 			element_info = self.captured_element_text_map[index]
-			print(f'      ✅ Found element {index} in captured map!')
-			print(f'         Element info: {element_info}')
+			logger.debug('      ✅ Found element %s in captured map: %s', index, element_info)
 			# Normalize and return
 			normalized = self._normalize_element_data(element_info)
 			if normalized:
 				self.element_hash_map[index] = normalized['element_hash']
 				return normalized
 
-		# Print the full state dict to see what browser-use provides
 		try:
-			state_dict = history.state.to_dict()
-			print(f'      State dict keys: {state_dict.keys()}')
-
-			# Check if tabs have element information
-			if 'tabs' in state_dict and state_dict['tabs']:
-				first_tab = state_dict['tabs'][0]
-				print(f'      First tab keys: {first_tab.keys()}')
-
-				# Look for selector map or interactive elements
-				if 'selector_map' in first_tab:
-					print(f'      Found selector_map with {len(first_tab["selector_map"])} entries')
-					# Check if our index is in the selector map
-					if str(index) in first_tab['selector_map']:
-						element_info = first_tab['selector_map'][str(index)]
-						print(f'      ✅ Found element {index} in selector_map!')
-						print(f'         Element info: {element_info}')
-						# Normalize and return
-						normalized = self._normalize_element_data(element_info)
-						if normalized:
-							self.element_hash_map[index] = normalized['element_hash']
-							return normalized
-
-				# Check for interactive_elements field
-				if 'interactive_elements' in first_tab:
-					elements = first_tab['interactive_elements']
-					print(f'      Found interactive_elements with {len(elements)} entries')
-					# Find element by index
-					for elem in elements:
-						if elem.get('index') == index or elem.get('highlight_index') == index:
-							print(f'      ✅ Found element {index} in interactive_elements!')
-							print(f'         Element: {elem}')
-							# Normalize and return
-							normalized = self._normalize_element_data(elem)
-							if normalized:
-								self.element_hash_map[index] = normalized['element_hash']
-								return normalized
+			selector_map, interactive_by_index = get_state_index()
+
+			# Look for the element in the selector map, then in interactive elements
+			for source, element_info in (
+				('selector_map', selector_map.get(str(index))),
+				('interactive_elements', interactive_by_index.get(index)),
+			):
+				if element_info is None:
+					continue
+				logger.debug('      ✅ Found element %s in %s: %s', index, source, element_info)
+				# Normalize and return
+				normalized = self._normalize_element_data(element_info)
+				if normalized:
+					self.element_hash_map[index] = normalized['element_hash']
+					return normalized
 		except Exception as e:
-			print(f'      Error accessing state dict: {e}')
+			logger.debug('      Error accessing state dict: %s', e)
 
-		# Fallback to old method
-		interacted_elements = history.state.interacted_element
-		print(f'      Number of interacted elements: {len(interacted_elements)}')
-
-		# Try to find by highlight_index (the box number)
-		matching_element = None
-		for i, element in enumerate(interacted_elements):
-			if element:
-				if hasattr(element, 'highlight_index') and element.highlight_index == index:
-					matching_element = element
-					print('      ✓ Found by highlight_index match')
-					break
+		# Fallback to old method: find by highlight_index (the box number)
+		matching_element = highlight_map.get(index)
 
 		if matching_element is None:
-			print(f'   ⚠️  Could not find element with index {index} - returning None')
+			logger.debug('   ⚠️  Could not find element with index %s - returning None', index)
 			return None
 
 		# Normalize the element data
 		normalized = self._normalize_element_data(matching_element)
 		if normalized:
 			self.element_hash_map[index] = normalized['element_hash']
-			print(
-				f'   📍 Found element: tag={normalized.get("node_name")}, '
-				f'value="{normalized.get("node_value")[:50] if normalized.get("node_value") else ""}"'
-			)
-			print(f'      Attributes: {list(normalized.get("attributes", {}).keys())}')
-			print(f'      Hash: {normalized["element_hash"]}')
+			if logger.isEnabledFor(logging.DEBUG):
+				logger.debug(
+					'   📍 Found element: tag=%s, value="%s", attributes=%s, hash=%s',
+					normalized.get('node_name'),
+					(normalized.get('node_value') or '')[:50],
+					list(normalized['attributes']),
+					normalized['element_hash'],
+				)
 
 		return normalized
 
 	def _create_semantic_description(
-		self, action_type: str, base_description: str, agent_context: Dict[str, Any], target_text: Optional[str] = None
+		self,
+		action_type: str,
+		base_description: str,
+		reasoning_lower: str,
+		page_title: Optional[str],
+		target_text: Optional[str] = None,
 	) -> str:
 		"""
 		Create a semantically rich description using agent reasoning and context.
@@ -215,45 +487,22 @@ class DeterministicWorkflowConverter:
 		Args:
 		    action_type: The type of action
 		    base_description: The basic description
-		    agent_context: Context from agent reasoning
+		    reasoning_lower: Lowercased agent reasoning (AgentContext.reasoning_lower)
+		    page_title: Title of the page the action happened on
 		    target_text: Optional target text for the action
 
 		Returns:
 		    Enhanced description with semantic context
 		"""
-		reasoning = agent_context.get('reasoning') or ''
-		page_title = agent_context.get('page_title') or ''
-
-		# If we have agent reasoning, try to extract intent
-		if reasoning and isinstance(reasoning, str):
+		# If we have agent reasoning for a click, try to extract intent
+		if reasoning_lower and target_text and action_type in ('click', 'click_element'):
 			# Simple heuristic: extract action intent from reasoning
-			reasoning_lower = reasoning.lower()
-
-			# Look for intent keywords
-			intent_map = {
-				'click': ['click', 'select', 'choose', 'open'],
-				'navigation': ['navigate', 'go to', 'visit', 'open'],
-				'input': ['enter', 'type', 'input', 'fill'],
-				'scroll': ['scroll', 'view more', 'see more'],
-				'extract': ['extract', 'get', 'find', 'collect'],
-			}
-
-			# Find matching intent
-			for intent_type, keywords in intent_map.items():
-				if action_type in ['click', 'click_element'] and intent_type == 'click':
-					for keyword in keywords:
-						if keyword in reasoning_lower and target_text:
-							# Try to find what they're clicking on
-							if 'section' in reasoning_lower:
-								return f"Click on '{target_text}' to access section"
-							elif 'filing' in reasoning_lower or 'sec' in reasoning_lower:
-								return f"Click on '{target_text}' (Filings section)"
-							elif 'news' in reasoning_lower or 'press' in reasoning_lower:
-								return f"Click on '{target_text}' (News/Press Releases)"
-							elif 'event' in reasoning_lower or 'webcast' in reasoning_lower:
-								return f"Click on '{target_text}' (Events/Webcasts)"
-							elif 'presentation' in reasoning_lower:
-								return f"Click on '{target_text}' (Presentations)"
+			if any(keyword in reasoning_lower for keyword in _CLICK_INTENT_KEYWORDS):
+				# Try to find what they're clicking on
+				matched = set(_INTENT_RE.findall(reasoning_lower))
+				if matched:
+					_, suffix = min(_INTENT_SUFFIXES[m] for m in matched)
+					return f"Click on '{target_text}'{suffix}"
 
 		# Fallback to base description with page context
 		if page_title and action_type in ['click', 'input']:
@@ -261,11 +510,25 @@ class DeterministicWorkflowConverter:
 
 		return base_description
 
+	def _element_hash(self, key: str) -> str:
+		"""
+		Return the element_hash_hex identifier for an element key, memoized per converter.
+		"""
+		element_hash = self._hash_cache.get(key)
+		if element_hash is None:
+			element_hash = self._hash_cache[key] = element_hash_hex(key)
+		return element_hash
+
 	def _normalize_element_data(self, raw_data: Any) -> Dict[str, Any]:
 		"""
 		Normalize element data from various browser-use formats to a consistent structure.
+
+		Browser-use often hands over the same element object for consecutive actions, so
+		results are cached by object identity until the end of convert_history_to_steps.
 		"""
-		import hashlib
+		cached = self._norm_cache.get(id(raw_data))
+		if cached is not None and cached[0] is raw_data:
+			return cached[1]
 
 		# If it's already a dict from selector_map or interactive_elements
 		if isinstance(raw_data, dict):
@@ -274,58 +537,66 @@ class DeterministicWorkflowConverter:
 
 			# Extract text value from multiple possible fields, filtering out browser-use bugs
 			text_value = ''
-			for text_field in ['text', 'inner_text', 'textContent', 'innerText', 'node_value']:
-				potential_text = raw_data.get(text_field, '').strip()
-				if potential_text:
-					# IMPORTANT: browser-use sometimes provides JavaScript href as 'text' for anchor tags
-					# Skip this and try other fields (case-insensitive check)
-					if tag_name == 'a' and potential_text.lower().startswith('javascript:'):
-						continue
-					text_value = potential_text
-					break
+			raw_get = raw_data.get
+			for text_field in _TEXT_FIELDS:
+				potential_text = raw_get(text_field)
+				if not potential_text:
+					continue
+				potential_text = potential_text.strip() if isinstance(potential_text, str) else str(potential_text).strip()
+				if not potential_text:
+					continue
+				# IMPORTANT: browser-use sometimes provides JavaScript href as 'text' for anchor tags
+				# Skip this and try other fields (case-insensitive check on the prefix only)
+				if tag_name == 'a' and potential_text[:11].lower() == 'javascript:':
+					continue
+				text_value = potential_text
+				break
 
 			# Extract common fields with fallbacks
 			result = {
 				'node_name': tag_name,
 				'node_value': text_value,
-				'attributes': raw_data.get('attributes', {}),
+				'attributes': raw_get('attributes') or _EMPTY,
 				'xpath': raw_data.get('xpath') or raw_data.get('x_path') or '',
 			}
 
 			# IMPORTANT: Preserve selector_strategies for semantic/deterministic element finding
-			if 'selector_strategies' in raw_data:
-				result['selector_strategies'] = raw_data['selector_strategies']
+			selector_strategies = raw_get('selector_strategies', _MISSING)
+			if selector_strategies is not _MISSING:
+				result['selector_strategies'] = selector_strategies
 
 			# Compute element hash if we have the data
 			tag_name = result['node_name'].lower()
-			# Use xpath or a combination of attributes as hash source
-			hash_source = result['xpath'] or str(result['attributes'])
-			element_hash = hashlib.sha256(f'{tag_name}_{hash_source}'.encode()).hexdigest()[:10]
-
-			result['element_hash'] = element_hash
+			# Use xpath or a combination of attributes as hash source (the raw value, so missing
+			# attributes hash as '{}' and explicit None as 'None')
+			hash_source = result['xpath'] or str(raw_get('attributes', {}))
+			result['element_hash'] = self._element_hash(f'{tag_name}_{hash_source}')
 			result['element_object'] = raw_data  # Store raw for reference
 
+			self._norm_cache[id(raw_data)] = (raw_data, result)
 			return result
 
 		# If it's a DOM element object (fallback)
 		if hasattr(raw_data, 'node_name'):
 			tag_name = raw_data.node_name.lower() if hasattr(raw_data, 'node_name') else ''
 			element_browser_hash = getattr(raw_data, 'element_hash', '')
-			element_hash = hashlib.sha256(f'{tag_name}_{element_browser_hash}'.encode()).hexdigest()[:10]
+			element_hash = self._element_hash(f'{tag_name}_{element_browser_hash}')
 
-			return {
+			result = {
 				'node_name': getattr(raw_data, 'node_name', ''),
 				'node_value': getattr(raw_data, 'node_value', ''),
-				'attributes': getattr(raw_data, 'attributes', {}),
+				'attributes': getattr(raw_data, 'attributes', None) or _EMPTY,
 				'xpath': getattr(raw_data, 'x_path', ''),
 				'element_hash': element_hash,
 				'element_object': raw_data,
 			}
+			self._norm_cache[id(raw_data)] = (raw_data, result)
+			return result
 
 		return None
 
 	def _extract_target_text(
-		self, element_data: Optional[Dict[str, Any]], action_dict: Dict[str, Any], agent_context: Optional[Dict[str, Any]] = None
+		self, element_data: Optional[Dict[str, Any]], action_dict: Dict[str, Any], agent_context: Optional[AgentContext] = None
 	) -> str:
 		"""
 		Extract the best target_text for semantic targeting from element data.
@@ -354,43 +625,43 @@ class DeterministicWorkflowConverter:
 
 		# Skip node_value for input fields (they don't have text content, only values)
 		if node_value and node_name not in ['input', 'textarea', 'select']:
-			print(f'      ✓ Using node_value as target_text: "{node_value}"')
+			logger.debug('      ✓ Using node_value as target_text: "%s"', node_value)
 			return node_value
 
 		# Priority 2-5: Check high-value attributes in order
-		attributes = element_data.get('attributes', {})
-		for attr in ['aria-label', 'placeholder', 'title', 'alt']:
-			if attr in attributes and attributes[attr]:
-				text = str(attributes[attr]).strip()
-				if text:
-					print(f'      ✓ Using {attr} attribute as target_text: "{text}"')
-					return text
+		attributes = element_data.get('attributes') or _EMPTY
+		attrs_get = attributes.get
+		for attr in _HIGH_VALUE_ATTRS:
+			value = attrs_get(attr)
+			if value and (text := value.strip() if isinstance(value, str) else str(value).strip()):
+				logger.debug('      ✓ Using %s attribute as target_text: "%s"', attr, text)
+				return text
 
 		# Priority 6: Extract from agent reasoning using structured [ELEMENT: "text"] format
 		# The agent is instructed to use this format: [ELEMENT: "First Name"], [ELEMENT: "Search"], etc.
-		if agent_context and agent_context.get('reasoning'):
-			reasoning = agent_context['reasoning']
-			import re
+		if agent_context and agent_context.reasoning:
+			reasoning = agent_context.reasoning
 
-			# Debug: print the reasoning to see what we're working with
-			print(f'      📝 Agent reasoning: {reasoning[:200]}...')
+			logger.debug('      📝 Agent reasoning: %.200s...', reasoning)
 
 			# Primary Pattern: Extract from structured [ELEMENT: "text"] tag
 			# This is the most reliable since we explicitly ask the agent to use this format
 
-			# Find ALL [ELEMENT] tags and use the LAST one (closest to the action)
-			matches = list(re.finditer(r'\[ELEMENT:\s*["\']([^"\']+)["\']\]', reasoning))
-			if matches:
-				element_text = matches[-1].group(1).strip()  # Use last match
-				print(f'      ✓ Extracted from [ELEMENT] tag (last occurrence): "{element_text}"')
-				print(f'         (Found {len(matches)} [ELEMENT] tags total, using the last one)')
+			# Use the LAST [ELEMENT] tag (closest to the action), keeping only one match alive
+			last = None
+			for last in _ELEMENT_TAG_QUOTED_RE.finditer(reasoning):
+				pass
+			if last is not None:
+				element_text = last.group(1).strip()
+				logger.debug('      ✓ Extracted from [ELEMENT] tag (last occurrence): "%s"', element_text)
 				return element_text
 
-			# Try without quotes as fallback: [ELEMENT: Search]
-			matches = list(re.finditer(r'\[ELEMENT:\s*([^\]]+)\]', reasoning))
-			if matches:
-				element_text = matches[-1].group(1).strip()  # Use last match
-				print(f'      ✓ Extracted from [ELEMENT] tag (no quotes, last occurrence): "{element_text}"')
+			# Try without quotes as fallback: [ELEMENT: Search] (last is still None here)
+			for last in _ELEMENT_TAG_BARE_RE.finditer(reasoning):
+				pass
+			if last is not None:
+				element_text = last.group(1).strip()
+				logger.debug('      ✓ Extracted from [ELEMENT] tag (no quotes, last occurrence): "%s"', element_text)
 				return element_text
 
 			# Fallback patterns for when agent doesn't follow the structured format:
@@ -402,99 +673,47 @@ class DeterministicWorkflowConverter:
 			if action_value:
 				# Pattern: Look for the value followed by field name mention
 				# E.g., "'Jasmine' into the First Name field" or "input 'Paxton'... Last Name"
-				escaped_value = re.escape(str(action_value))
-				# Match: value (with quotes or not) + optional words + "into/in/for" + field name + "field/input"
-				match = re.search(
-					rf'["\']?{escaped_value}["\']?[^.]*?(?:into|in|for|to)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)',
-					reasoning,
-					re.IGNORECASE,
-				)
+				match = _value_context_re(str(action_value)).search(reasoning)
 				if match:
 					label_text = match.group(1).strip()
-					print(f'      ✓ Extracted from agent reasoning (context: "{action_value}"): "{label_text}"')
+					logger.debug('      ✓ Extracted from agent reasoning (context: "%s"): "%s"', action_value, label_text)
 					return label_text
 
 			# Fallback: Pattern 1: "into the First Name field" (first occurrence)
-			match = re.search(r'(?:into|in|for)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)', reasoning)
+			match = _FIELD_CONTEXT_RE.search(reasoning)
 			if match:
 				label_text = match.group(1).strip()
-				print(f'      ✓ Extracted from agent reasoning: "{label_text}"')
+				logger.debug('      ✓ Extracted from agent reasoning: "%s"', label_text)
 				return label_text
 
 			# Fallback: Pattern 2: "First Name field" or "Last Name input"
-			match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:field|input|box)', reasoning)
+			match = _FIELD_SIMPLE_RE.search(reasoning)
 			if match:
 				label_text = match.group(1).strip()
-				print(f'      ✓ Extracted from agent reasoning: "{label_text}"')
+				logger.debug('      ✓ Extracted from agent reasoning: "%s"', label_text)
 				return label_text
 
 			# Fallback: Pattern 3: "click the Search button" or "click on Search" (for button/link clicks)
-			match = re.search(
-				r'(?:click|tap|press)\s+(?:on\s+)?(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:button|link)',
-				reasoning,
-				re.IGNORECASE,
-			)
+			match = _BUTTON_RE.search(reasoning)
 			if match:
 				button_text = match.group(1).strip()
-				print(f'      ✓ Extracted button text from agent reasoning: "{button_text}"')
+				logger.debug('      ✓ Extracted button text from agent reasoning: "%s"', button_text)
 				return button_text
 
 		# Priority 7-8: Check name/id attributes, but skip or convert technical/generated IDs
-		def is_human_readable(text: str) -> bool:
-			"""Check if text is human-readable, not a technical ID."""
-			text_lower = text.lower()
-			# Skip if contains common technical patterns
-			technical_patterns = ['$', 'ctl', 'ctr', 'dnn', 'aspnet', 'viewstate', '__', 'guid']
-			if any(pattern in text_lower for pattern in technical_patterns):
-				return False
-			# Skip if mostly uppercase/numbers (like GUID fragments)
-			if len([c for c in text if c.isupper() or c.isdigit()]) > len(text) * 0.7:
-				return False
-			return True
-
-		def extract_semantic_part(technical_id: str) -> str | None:
-			"""Try to extract semantic meaning from technical IDs like 'dnn$ctr434$SQLViewPro$FirstName$txtParameter'."""
-			# Split by common separators
-			parts = technical_id.replace('$', '.').replace('_', '.').split('.')
-
-			# Look for parts that might be semantic (e.g., "FirstName", "LastName", "Search")
-			for part in reversed(parts):  # Check from end first (more specific)
-				# Skip common technical suffixes
-				if part.lower() in ['txt', 'txtparameter', 'parameter', 'ctrl', 'control', 'btn', 'button', 'lbl', 'label']:
-					continue
-				# Skip very short parts (likely not semantic)
-				if len(part) < 3:
-					continue
-				# Skip numeric parts
-				if part.isdigit():
-					continue
-				# Skip parts that look like prefixes (all caps)
-				if part.isupper() and len(part) < 5:
-					continue
-
-				# Found a potentially semantic part - convert camelCase to readable text
-				# E.g., "FirstName" -> "First Name"
-				import re
-
-				# Insert space before capital letters
-				readable = re.sub(r'([a-z])([A-Z])', r'\1 \2', part)
-				print(f'      ✓ Extracted semantic text from {technical_id}: "{readable}"')
-				return readable
-
-			return None
-
-		for attr in ['name', 'id']:
-			if attr in attributes and attributes[attr]:
-				text = str(attributes[attr]).strip()
-				if text and is_human_readable(text):
-					print(f'      ✓ Using {attr} attribute as target_text: "{text}"')
+		for attr in _NAME_ID_ATTRS:
+			value = attrs_get(attr)
+			if value:
+				text = value.strip() if isinstance(value, str) else str(value).strip()
+				if text and _is_human_readable(text):
+					logger.debug('      ✓ Using %s attribute as target_text: "%s"', attr, text)
 					return text
 				elif text:
 					# Try to extract semantic meaning from technical IDs
-					semantic_text = extract_semantic_part(text)
+					semantic_text = _extract_semantic_part(text)
 					if semantic_text:
 						return semantic_text
-					print(f'      ⚠️  Skipping technical {attr} attribute: "{text}"')
+					logger.debug('      ⚠️  Skipping technical %s attribute: "%s"', attr, text)
 
 		# Priority 8: For anchor tags, extract meaningful text from href
 		if node_name == 'a' and 'href' in attributes:
@@ -509,19 +728,18 @@ class DeterministicWorkflowConverter:
 					# Convert URL-friendly text to readable text
 					# E.g., "sec-filings" -> "SEC Filings"
 					# Skip generic terms
-					skip_terms = ['www.edison.com', 'edison.com', 'investors', 'www', 'com', 'http:', 'https:']
-					if last_part and last_part not in skip_terms:
+					if last_part and last_part not in _SKIP_HREF_TERMS:
 						text = last_part.replace('-', ' ').replace('_', ' ').title()
-						print(f'      ✓ Extracted from href as target_text: "{text}"')
+						logger.debug('      ✓ Extracted from href as target_text: "%s"', text)
 						return text
 
 		# Priority 9: Fallback - use descriptive element type
 		# NEVER use action_dict.get('text') - that's the input VALUE, not a semantic identifier!
 		if node_name:
-			print(f'      ⚠️  No good target text found, using node name: "{node_name}"')
+			logger.debug('      ⚠️  No good target text found, using node name: "%s"', node_name)
 			return f'{node_name} element'
 
-		print('      ⚠️  No target text found at all')
+		logger.debug('      ⚠️  No target text found at all')
 		return 'element'
 
 	def _add_wait_time_to_step(self, step: Dict[str, Any], step_duration: Optional[float]) -> Dict[str, Any]:
@@ -529,7 +747,20 @@ class DeterministicWorkflowConverter:
 		if step_duration is not None and step_duration > 0:
 			wait_time = round(step_duration * 0.75, 2)
 			step['wait_time'] = wait_time
-			print(f'   ⏱️  Set wait_time={wait_time}s (based on {step_duration}s execution)')
+			logger.debug('   ⏱️  Set wait_time=%ss (based on %ss execution)', wait_time, step_duration)
+		return step
+
+	def _stamp_context(
+		self, step: Dict[str, Any], agent_context: AgentContext, include_url: bool = True, include_title: bool = False
+	) -> Dict[str, Any]:
+		"""Copy agent reasoning and page context onto a step, skipping empty values."""
+		reasoning, page_url, page_title, _ = agent_context
+		if reasoning:
+			step['agent_reasoning'] = reasoning
+		if include_url and page_url:
+			step['page_context_url'] = page_url
+		if include_title and page_title:
+			step['page_context_title'] = page_title
 		return step
 
 	def _convert_action_to_step(
@@ -537,7 +768,7 @@ class DeterministicWorkflowConverter:
 		action_type: str,
 		action_dict: Dict[str, Any],
 		element_data: Optional[Dict[str, Any]],
-		agent_context: Optional[Dict[str, Any]] = None,
+		agent_context: Optional[AgentContext] = None,
 		step_duration: Optional[float] = None,
 	) -> Optional[Dict[str, Any]]:
 		"""
@@ -557,330 +788,335 @@ class DeterministicWorkflowConverter:
 		- send_keys → keypress step
 		- extract, extract_content, extract_page_content → extract_page_content step
 		- scroll → scroll step
+		- select_dropdown_option → click step
+		- go_back, go_forward → history navigation steps
 		"""
-		agent_context = agent_context or {}
-
-		# Navigation actions
-		if action_type in ['navigate', 'go_to_url']:
-			url = action_dict.get('url', '')
-			step = {
-				'type': 'navigation',
-				'url': url,
-				'description': f'Navigate to {url}',
-				'expected_outcome': f'Successfully navigated to {url} and page loaded',
-				# Deterministic verification checks
-				'verification_checks': [
-					{
-						'name': 'url_changed',
-						'method': 'deterministic',
-						'check_function': 'check_url_matches',
-						'description': f'Verify URL changed to {url}',
-						'parameters': {'expected_url': url},
-					},
-					{
-						'name': 'page_loaded',
-						'method': 'deterministic',
-						'check_function': 'check_page_loaded',
-						'description': 'Verify page finished loading',
-					},
-				],
-			}
-
-			# Add semantic metadata for navigation
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-
+		handler = self._handlers.get(action_type)
+		if handler:
+			step = handler(action_type, action_dict, element_data, agent_context or _EMPTY_CONTEXT)
 			return self._add_wait_time_to_step(step, step_duration)
 
-		# Input text actions (browser-use can use either 'input' or 'input_text')
-		elif action_type in ['input', 'input_text']:
-			target_text = self._extract_target_text(element_data, action_dict, agent_context)
-			# Ensure target_text is never empty
-			if not target_text:
-				target_text = 'input field'
-
-			input_value = action_dict.get('text', '')
-			step = {
-				'type': 'input',
-				'target_text': target_text,
-				'value': input_value,
-				'description': f'Enter text into {target_text}',
-				'expected_outcome': f'Input field "{target_text}" populated with value and no validation errors',
-				# Deterministic verification checks
-				'verification_checks': [
-					{
-						'name': 'input_value_set',
-						'method': 'deterministic',
-						'check_function': 'check_input_value',
-						'description': 'Verify input field contains the entered value',
-						'parameters': {'target_text': target_text, 'expected_value': input_value},
-					},
-					{
-						'name': 'no_validation_errors',
-						'method': 'deterministic',
-						'check_function': 'check_no_validation_errors',
-						'description': 'Verify no validation errors appeared',
-					},
-				],
-			}
-
-			# Add element hash for selector population
-			if element_data and element_data.get('element_hash'):
-				step['elementHash'] = element_data['element_hash']
-
-			# Add multi-strategy selectors for robust element finding
-			if element_data and element_data.get('selector_strategies'):
-				step['selectorStrategies'] = element_data['selector_strategies']
-
-			# Add semantic metadata
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-			if agent_context.get('page_url'):
-				step['page_context_url'] = agent_context['page_url']
+		# Actions we skip or handle differently
+		if action_type in _SKIPPED_ACTIONS:
+			return None  # These don't translate to workflow steps
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Unknown action type - log a warning (only if not empty)
+		if action_type:
+			logger.warning('⚠️  Unknown action type: %s - skipping', action_type)
+		return None
 
-		# Click actions (browser-use uses 'click', not 'click_element')
-		elif action_type in ['click', 'click_element']:
-			target_text = self._extract_target_text(element_data, action_dict, agent_context)
-			# Ensure target_text is never empty
-			if not target_text:
-				target_text = 'element'
-
-			# Check if this looks like a dynamic identifier (ID, code, number, etc.) that should be made generic
-			import re
-
-			position_hint = None
-			container_hint = None
-
-			# Define common dynamic identifier patterns
-			# Require at least one digit to avoid matching regular words
-			alphanumeric_id = re.match(r'^[A-Z]{2,}\d{3,}$', target_text)  # e.g., AP00945776, ABC123
-			numeric_id = re.match(r'^\d{3,}$', target_text)  # e.g., 123456, 00945776
-			code_with_separator = re.match(
-				r'^[A-Z0-9]+[-_][A-Z0-9]*\d+[A-Z0-9]*$', target_text, re.IGNORECASE
-			)  # e.g., ORD-12345, user_456, TKT-9876
-
-			if alphanumeric_id or numeric_id or code_with_separator:
-				print(f'      🔍 Detected dynamic identifier pattern: "{target_text}"')
-
-				# Check agent reasoning for context to determine the semantic meaning
-				reasoning = agent_context.get('reasoning', '') if agent_context else ''
-				reasoning_lower = reasoning.lower()
-
-				original_target = target_text
-
-				# Map reasoning keywords to generic identifiers
-				# This makes workflows reusable across different records
-				semantic_mapping = {
-					'license': 'license number link',
-					'provider': 'provider id link',
-					'order': 'order id link',
-					'invoice': 'invoice number link',
-					'ticket': 'ticket number link',
-					'case': 'case number link',
-					'patient': 'patient id link',
-					'user': 'user id link',
-					'customer': 'customer id link',
-					'product': 'product code link',
-					'transaction': 'transaction id link',
-					'record': 'record id link',
-				}
+	def _step_navigate(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a navigation step."""
+		url = action_dict.get('url', '')
+		step = {
+			'type': 'navigation',
+			'url': url,
+			'description': _DESC_NAV + url,
+			'expected_outcome': f'Successfully navigated to {url} and page loaded',
+			# Deterministic verification checks
+			'verification_checks': [
+				{
+					'name': 'url_changed',
+					'method': 'deterministic',
+					'check_function': 'check_url_matches',
+					'description': f'Verify URL changed to {url}',
+					'parameters': {'expected_url': url},
+				},
+				{
+					'name': 'page_loaded',
+					'method': 'deterministic',
+					'check_function': 'check_page_loaded',
+					'description': 'Verify page finished loading',
+				},
+			],
+		}
 
-				# Try to find semantic meaning from reasoning
-				converted = False
-				for keyword, generic_name in semantic_mapping.items():
-					if keyword in reasoning_lower:
-						target_text = generic_name
-						position_hint = 'first'  # Usually click the first result
-						container_hint = 'search results'
-						print(f'      ✅ Converted to generic: "{target_text}" (detected: {keyword})')
-						print(f'         Position: {position_hint}, Container: {container_hint}')
-						print(f'         Original value "{original_target}" will match via pattern')
-						converted = True
-						break
+		# Add semantic metadata for navigation
+		return self._stamp_context(step, agent_context, include_url=False)
 
-				# If no semantic meaning found, use generic "id link"
-				if not converted:
-					target_text = 'id link'
-					position_hint = 'first'
-					container_hint = 'search results'
-					print(f'      ✅ Converted to generic: "{target_text}" (no specific context detected)')
-					print(f'         Position: {position_hint}, Container: {container_hint}')
-					print(f'         Original value "{original_target}" will match via pattern')
-
-			# Create semantic description
-			base_description = f'Click on {target_text}'
-			description = self._create_semantic_description(action_type, base_description, agent_context, target_text)
-
-			step = {
-				'type': 'click',
-				'target_text': target_text,
-				'description': description,
-				'expected_outcome': f'Successfully clicked "{target_text}" and page/state updated',
-				# Deterministic verification check - verify page state changed
-				'verification_checks': [
-					{
-						'name': 'page_state_changed',
-						'method': 'deterministic',
-						'check_function': 'check_page_state_changed',
-						'description': 'Verify page or DOM state changed after click',
-					}
-				],
-			}
+	def _step_input(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build an input step targeting the field by its semantic text."""
+		target_text = self._extract_target_text(element_data, action_dict, agent_context)
+		# Ensure target_text is never empty
+		if not target_text:
+			target_text = 'input field'
+
+		input_value = action_dict.get('text', '')
+		step = {
+			'type': 'input',
+			'target_text': target_text,
+			'value': input_value,
+			'description': _DESC_INPUT + target_text,
+			'expected_outcome': f'Input field "{target_text}" populated with value and no validation errors',
+			# Deterministic verification checks
+			'verification_checks': [
+				{
+					'name': 'input_value_set',
+					'method': 'deterministic',
+					'check_function': 'check_input_value',
+					'description': 'Verify input field contains the entered value',
+					'parameters': {'target_text': target_text, 'expected_value': input_value},
+				},
+				{
+					'name': 'no_validation_errors',
+					'method': 'deterministic',
+					'check_function': 'check_no_validation_errors',
+					'description': 'Verify no validation errors appeared',
+				},
+			],
+		}
 
-			# Add position and container hints if detected
-			if position_hint:
-				step['position_hint'] = position_hint
-			if container_hint:
-				step['container_hint'] = container_hint
+		# Add element hash for selector population
+		if element_data and element_data.get('element_hash'):
+			step['elementHash'] = element_data['element_hash']
 
-			# Add element hash for selector population
-			if element_data and element_data.get('element_hash'):
-				step['elementHash'] = element_data['element_hash']
+		# Add multi-strategy selectors for robust element finding
+		if element_data and element_data.get('selector_strategies'):
+			step['selectorStrategies'] = element_data['selector_strategies']
 
-			# Add multi-strategy selectors for robust element finding
-			if element_data and element_data.get('selector_strategies'):
-				step['selectorStrategies'] = element_data['selector_strategies']
+		# Add semantic metadata
+		return self._stamp_context(step, agent_context)
 
-			# Add semantic metadata (optional fields that provide context)
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-			if agent_context.get('page_url'):
-				step['page_context_url'] = agent_context['page_url']
-			if agent_context.get('page_title'):
-				step['page_context_title'] = agent_context['page_title']
+	def _step_click(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a click step, generalizing dynamic identifiers (IDs, codes) from the recording."""
+		_, _, page_title, reasoning_lower = agent_context
+		target_text = self._extract_target_text(element_data, action_dict, agent_context)
+		# Ensure target_text is never empty
+		if not target_text:
+			target_text = 'element'
+
+		# Check if this looks like a dynamic identifier (ID, code, number, etc.) that should be made generic
+		position_hint = None
+		container_hint = None
+
+		# Check common dynamic identifier patterns
+		if _DYNAMIC_ID_RE.match(target_text):
+			logger.debug('      🔍 Detected dynamic identifier pattern: "%s"', target_text)
+
+			original_target = target_text
+
+			# Check agent reasoning for context to determine the semantic meaning
+			found = set(_SEMANTIC_KEYWORDS_RE.findall(reasoning_lower))
+			if found:
+				_, target_text = min(_SEMANTIC_GENERIC[keyword] for keyword in found)
+				position_hint = 'first'  # Usually click the first result
+				container_hint = 'search results'
+				logger.debug(
+					'      ✅ Converted to generic: "%s" (detected: %s, position: %s, container: %s, original value "%s")',
+					target_text,
+					found,
+					position_hint,
+					container_hint,
+					original_target,
+				)
+			else:
+				# If no semantic meaning found, use generic "id link"
+				target_text = 'id link'
+				position_hint = 'first'
+				container_hint = 'search results'
+				logger.debug(
+					'      ✅ Converted to generic: "%s" (no specific context detected, position: %s, container: %s, original value "%s")',
+					target_text,
+					position_hint,
+					container_hint,
+					original_target,
+				)
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Create semantic description
+		base_description = _DESC_CLICK + target_text
+		description = self._create_semantic_description(action_type, base_description, reasoning_lower, page_title, target_text)
 
-		# Keyboard actions
-		elif action_type == 'send_keys':
-			# For send_keys, we might not have a specific element
-			# If it's a simple key like "Enter", create a keypress step
-			keys = action_dict.get('keys', '')
-
-			# Try to get target from last interacted element if available
-			target_text = self._extract_target_text(element_data, action_dict, agent_context)
-			# Ensure target_text is never empty
-			if not target_text:
-				target_text = 'page'
-
-			step = {
-				'type': 'key_press',
-				'key': keys,
-				'target_text': target_text,
-				'description': f'Press {keys} key',
-				'expected_outcome': f'Key "{keys}" pressed successfully',
-			}
+		step = {
+			'type': 'click',
+			'target_text': target_text,
+			'description': description,
+			'expected_outcome': f'Successfully clicked "{target_text}" and page/state updated',
+			# Deterministic verification check - verify page state changed
+			'verification_checks': [
+				{
+					'name': 'page_state_changed',
+					'method': 'deterministic',
+					'check_function': 'check_page_state_changed',
+					'description': 'Verify page or DOM state changed after click',
+				}
+			],
+		}
 
-			# Add element hash for selector population
-			if element_data and element_data.get('element_hash'):
-				step['elementHash'] = element_data['element_hash']
+		# Add position and container hints if detected
+		if position_hint:
+			step['position_hint'] = position_hint
+		if container_hint:
+			step['container_hint'] = container_hint
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Add element hash for selector population
+		if element_data and element_data.get('element_hash'):
+			step['elementHash'] = element_data['element_hash']
 
-		# Extract content actions (browser-use can use 'extract', 'extract_content', or 'extract_page_content')
-		elif action_type in ['extract', 'extract_page_content', 'extract_content']:
-			# Browser-use may use different field names for extraction goal
-			goal = (
-				action_dict.get('value')
-				or action_dict.get('goal')
-				or action_dict.get('content')
-				or action_dict.get('query')
-				or 'page content'
-			)
-			step = {
-				'type': 'extract_page_content',
-				'goal': goal,
-				'description': f'Extract: {goal}',
-				'expected_outcome': f'Successfully extracted: {goal}',
-			}
-			return self._add_wait_time_to_step(step, step_duration)
+		# Add multi-strategy selectors for robust element finding
+		if element_data and element_data.get('selector_strategies'):
+			step['selectorStrategies'] = element_data['selector_strategies']
 
-		# Scroll actions
-		elif action_type == 'scroll':
-			# Convert browser-use scroll (down: bool, pages: float) to workflow scroll (scrollX, scrollY: int)
-			# Estimate 800 pixels per page
-			down = action_dict.get('down', True)
-			pages = action_dict.get('pages', 1.0)
-			pixels = int(pages * 800)
-
-			step = {
-				'type': 'scroll',
-				'scrollX': 0,
-				'scrollY': pixels if down else -pixels,
-				'description': f'Scroll {"down" if down else "up"} {pages} pages',
-				'expected_outcome': f'Page scrolled {"down" if down else "up"} by {pixels} pixels',
-				# Deterministic verification check
-				'verification_checks': [
-					{
-						'name': 'scroll_position_changed',
-						'method': 'deterministic',
-						'check_function': 'check_scroll_position',
-						'description': 'Verify scroll position changed',
-					}
-				],
-			}
+		# Add semantic metadata (optional fields that provide context)
+		return self._stamp_context(step, agent_context, include_title=True)
 
-			# Add semantic metadata
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-			if agent_context.get('page_url'):
-				step['page_context_url'] = agent_context['page_url']
+	def _step_send_keys(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a key press step."""
+		# For send_keys, we might not have a specific element
+		# If it's a simple key like "Enter", create a keypress step
+		keys = action_dict.get('keys', '')
+
+		# Try to get target from last interacted element if available
+		target_text = self._extract_target_text(element_data, action_dict, agent_context)
+		# Ensure target_text is never empty
+		if not target_text:
+			target_text = 'page'
+
+		step = {
+			'type': 'key_press',
+			'key': keys,
+			'target_text': target_text,
+			'description': _DESC_KEYPRESS + keys + _DESC_KEYPRESS_SUFFIX,
+			'expected_outcome': f'Key "{keys}" pressed successfully',
+		}
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Add element hash for selector population
+		if element_data and element_data.get('element_hash'):
+			step['elementHash'] = element_data['element_hash']
 
-		# Dropdown actions - convert to click for now
-		elif action_type == 'select_dropdown_option':
-			target_text = action_dict.get('text', '')
-			step = {
-				'type': 'click',
-				'target_text': target_text,
-				'description': f'Select dropdown option: {target_text}',
-				'expected_outcome': f'Dropdown option "{target_text}" selected',
-			}
-			return self._add_wait_time_to_step(step, step_duration)
+		return step
 
-		# Navigation actions
-		elif action_type == 'go_back':
-			step = {
-				'type': 'go_back',
-				'description': 'Navigate back to previous page',
-				'expected_outcome': 'Successfully navigated back to previous page',
-			}
+	def _step_extract(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build an extract_page_content step."""
+		# Browser-use may use different field names for extraction goal
+		goal = (
+			action_dict.get('value')
+			or action_dict.get('goal')
+			or action_dict.get('content')
+			or action_dict.get('query')
+			or 'page content'
+		)
+		step = {
+			'type': 'extract_page_content',
+			'goal': goal,
+			'description': f'Extract: {goal}',
+			'expected_outcome': f'Successfully extracted: {goal}',
+		}
+		return step
 
-			# Add semantic metadata
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-			if agent_context.get('page_url'):
-				step['page_context_url'] = agent_context['page_url']
+	def _step_scroll(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a scroll step from browser-use's page-based scroll parameters."""
+		# Convert browser-use scroll (down: bool, pages: float) to workflow scroll (scrollX, scrollY: int)
+		# Estimate 800 pixels per page
+		down = action_dict.get('down', True)
+		pages = action_dict.get('pages', 1.0)
+		pixels = int(pages * 800)
+
+		step = {
+			'type': 'scroll',
+			'scrollX': 0,
+			'scrollY': pixels if down else -pixels,
+			'description': f'Scroll {"down" if down else "up"} {pages} pages',
+			'expected_outcome': f'Page scrolled {"down" if down else "up"} by {pixels} pixels',
+			# Deterministic verification check
+			'verification_checks': [
+				{
+					'name': 'scroll_position_changed',
+					'method': 'deterministic',
+					'check_function': 'check_scroll_position',
+					'description': 'Verify scroll position changed',
+				}
+			],
+		}
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Add semantic metadata
+		return self._stamp_context(step, agent_context)
 
-		elif action_type == 'go_forward':
-			step = {
-				'type': 'go_forward',
-				'description': 'Navigate forward to next page',
-				'expected_outcome': 'Successfully navigated forward to next page',
-			}
+	def _step_dropdown(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a click step for a dropdown option (dropdowns are converted to clicks for now)."""
+		target_text = action_dict.get('text', '')
+		step = {
+			'type': 'click',
+			'target_text': target_text,
+			'description': f'Select dropdown option: {target_text}',
+			'expected_outcome': f'Dropdown option "{target_text}" selected',
+		}
+		return step
 
-			# Add semantic metadata
-			if agent_context.get('reasoning'):
-				step['agent_reasoning'] = agent_context['reasoning']
-			if agent_context.get('page_url'):
-				step['page_context_url'] = agent_context['page_url']
+	def _step_go_back(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a go_back step."""
+		step = {
+			'type': 'go_back',
+			'description': 'Navigate back to previous page',
+			'expected_outcome': 'Successfully navigated back to previous page',
+		}
 
-			return self._add_wait_time_to_step(step, step_duration)
+		# Add semantic metadata
+		return self._stamp_context(step, agent_context)
 
-		# Actions we skip or handle differently
-		elif action_type in ['done', 'switch_tab', 'close_tab', 'write_file', 'replace_file', 'read_file', 'search_google']:
-			return None  # These don't translate to workflow steps
+	def _step_go_forward(
+		self,
+		action_type: str,
+		action_dict: Dict[str, Any],
+		element_data: Optional[Dict[str, Any]],
+		agent_context: AgentContext,
+	) -> Dict[str, Any]:
+		"""Build a go_forward step."""
+		step = {
+			'type': 'go_forward',
+			'description': 'Navigate forward to next page',
+			'expected_outcome': 'Successfully navigated forward to next page',
+		}
 
-		else:
-			# Unknown action type - log a warning (only if not empty)
-			if action_type:
-				print(f'⚠️  Unknown action type: {action_type} - skipping')
-			return None
+		# Add semantic metadata
+		return self._stamp_context(step, agent_context)
 
 	def create_workflow_definition(
 		self,
@@ -889,6 +1125,7 @@ class DeterministicWorkflowConverter:
 		steps: List[Dict[str, Any]],
 		input_schema: Optional[List[Dict[str, Any]]] = None,
 		version: str = '1.0.0',
+		validate: bool = False,
 	) -> Dict[str, Any]:
 		"""
 		Create a complete workflow definition from converted steps.
@@ -899,14 +1136,41 @@ class DeterministicWorkflowConverter:
 		    steps: List of converted step dictionaries
 		    input_schema: Optional list of input variable definitions
 		    version: Workflow version (default: '1.0.0')
+		    validate: If True, check the definition against WorkflowDefinitionSchema before returning.
+		        Off by default since callers usually build the schema model from the result anyway.
 
 		Returns:
 		    Complete workflow definition dictionary
+
+		Raises:
+		    pydantic.ValidationError: If validate is True and the definition is invalid
 		"""
-		return {
+		definition = {
 			'name': name,
 			'description': description,
 			'version': version,
 			'input_schema': input_schema or [],
 			'steps': steps,
 		}
+		if validate:
+			# pydantic-core builds the schema validator once at import, so this reuses the compiled validator
+			WorkflowDefinitionSchema.model_validate(definition)
+		return definition
+
+	def save_workflow_definition(self, workflow: Dict[str, Any], path: Path) -> None:
+		"""
+		Write a workflow definition to a JSON file, indented by 2 spaces.
+
+		Uses orjson when it is installed, which serializes straight to bytes and is much
+		faster than the stdlib encoder on recordings with many steps.
+
+		Args:
+		    workflow: Workflow definition, as returned by create_workflow_definition
+		    path: Destination file path
+		"""
+		path = Path(path)
+		if orjson is not None:
+			path.write_bytes(orjson.dumps(workflow, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+		else:
+			with open(path, 'w') as f:
+				json.dump(workflow, f, indent=2)
@@ -5,9 +5,12 @@ This module generates multiple fallback strategies to find elements on a page,
 reducing dependence on AI and making workflows more deterministic.
 """
 
+import functools
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from workflow_use.healing.xpath_optimizer import XPathOptimizer
 
@@ -15,9 +18,51 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+	"""Intern str values so repeated labels across steps share one object; other values pass through."""
+	return sys.intern(value) if type(value) is str else value
+
+
+# Text this short is not selective on its own (see _SHORT_TEXT_PENALTY)
+_SHORT_TEXT_LENGTH = 3
+
+# Added to the text_exact/role_text priorities (1/2 -> 7/8) of short-text elements that also carry
+# one of _LABEL_ATTRS, moving them strictly behind the aria_label (3) ... alt_text (6) strategies.
+# This also ranks them behind optimized XPath strategies (priority 2-6).
+_SHORT_TEXT_PENALTY = 6
+_LABEL_ATTRS = ('aria-label', 'placeholder', 'title', 'alt')
+
+# Implicit ARIA role of common HTML tags
+_ROLE_MAP = {
+	'button': 'button',
+	'a': 'link',
+	'input': 'textbox',
+	'textarea': 'textbox',
+	'select': 'combobox',
+	'h1': 'heading',
+	'h2': 'heading',
+	'h3': 'heading',
+	'h4': 'heading',
+	'h5': 'heading',
+	'h6': 'heading',
+	'img': 'img',
+	'table': 'table',
+	'ul': 'list',
+	'ol': 'list',
+	'nav': 'navigation',
+}
+
+# <input type=...> values whose role differs from a plain textbox
+_INPUT_ROLE = {
+	'checkbox': 'checkbox',
+	'radio': 'radio',
+	'submit': 'button',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SelectorStrategy:
-	"""A single selector strategy with priority and metadata."""
+	"""A single selector strategy with priority and metadata (immutable, since generated strategies are shared)."""
 
 	type: str  # Strategy type: 'id', 'css_attr', 'text_exact', 'aria', etc.
 	value: str  # The selector value or matching text
@@ -30,17 +75,20 @@ class SelectorStrategy:
 			'type': self.type,
 			'value': self.value,
 			'priority': self.priority,
-			'metadata': self.metadata,
+			'metadata': dict(self.metadata),
 		}
 
 	@classmethod
 	def from_dict(cls, data: Dict[str, Any]) -> 'SelectorStrategy':
 		"""Create from dictionary."""
+		metadata = data.get('metadata', {})
+		if isinstance(metadata, dict) and type(metadata.get('role')) is str:
+			metadata = {**metadata, 'role': sys.intern(metadata['role'])}
 		return cls(
-			type=data['type'],
-			value=data['value'],
+			type=_intern(data['type']),
+			value=_intern(data['value']),
 			priority=data['priority'],
-			metadata=data.get('metadata', {}),
+			metadata=metadata,
 		)
 
 
@@ -80,6 +128,8 @@ class SelectorGenerator:
 		self.max_xpath_alternatives = max_xpath_alternatives
 		self.max_total_strategies = max_total_strategies
 		self.xpath_optimizer = XPathOptimizer() if enable_xpath_optimization else None
+		# Per-instance memo, since the output depends on the settings above
+		self._cached_strategies = functools.lru_cache(maxsize=1024)(self._generate_for_signature)
 
 	def generate_strategies(self, element_data: Dict[str, Any], include_xpath_fallback: bool = True) -> List[SelectorStrategy]:
 		"""
@@ -110,30 +160,60 @@ class SelectorGenerator:
 		    ... )
 		    >>> # Returns: text_exact, role_text, aria_label, text_fuzzy, xpath
 		"""
+		try:
+			signature = (
+				element_data.get('tag_name', ''),
+				element_data.get('text', ''),
+				element_data.get('xpath', ''),
+				# Insertion order is kept: the XPath fallbacks use the first declared data-* attribute
+				tuple(element_data.get('attributes', {}).items()),
+				include_xpath_fallback,
+			)
+			hash(signature)
+		except (AttributeError, TypeError):
+			# Attributes that are not a dict of hashable values; generate without the cache
+			return self._generate_strategies(element_data, include_xpath_fallback)
+
+		return list(self._cached_strategies(signature))
+
+	def _generate_for_signature(self, signature: Tuple[Any, ...]) -> Tuple[SelectorStrategy, ...]:
+		"""Generate strategies for a hashable element signature built by generate_strategies."""
+		tag, text, xpath, attr_items, include_xpath_fallback = signature
+		element_data = {'tag_name': tag, 'text': text, 'xpath': xpath, 'attributes': dict(attr_items)}
+		return tuple(self._generate_strategies(element_data, include_xpath_fallback))
+
+	def _generate_strategies(self, element_data: Dict[str, Any], include_xpath_fallback: bool) -> List[SelectorStrategy]:
+		"""Build the strategy list for element_data; see generate_strategies."""
 		strategies = []
-		tag = element_data.get('tag_name', '').lower()
-		text = element_data.get('text', '').strip()
+		tag = _intern(element_data.get('tag_name', '').lower())
+		text = _intern(element_data.get('text', '').strip())
 		attrs = element_data.get('attributes', {})
 
+		# Short labels ("X", "OK", "Go") collide across a page, so when the element also has a
+		# labelling attribute, try that first by ranking the text strategies after it
+		text_penalty = 0
+		if len(text) <= _SHORT_TEXT_LENGTH and any(attrs.get(attr) for attr in _LABEL_ATTRS):
+			text_penalty = _SHORT_TEXT_PENALTY
+
 		# Strategy 1: Exact text match (highest priority - most reliable)
 		if text:
 			strategies.append(
 				SelectorStrategy(
 					type='text_exact',
 					value=text,
-					priority=1,
+					priority=1 + text_penalty,
 					metadata={'tag': tag},
 				)
 			)
 
 		# Strategy 2: Role + text (semantic HTML)
-		role = self._infer_role(tag, attrs)
+		role = _intern(self._infer_role(tag, attrs))
 		if role and text:
 			strategies.append(
 				SelectorStrategy(
 					type='role_text',
 					value=text,
-					priority=2,
+					priority=2 + text_penalty,
 					metadata={'role': role, 'tag': tag},
 				)
 			)
@@ -143,7 +223,7 @@ class SelectorGenerator:
 			strategies.append(
 				SelectorStrategy(
 					type='aria_label',
-					value=attrs['aria-label'],
+					value=_intern(attrs['aria-label']),
 					priority=3,
 					metadata={'tag': tag},
 				)
@@ -154,7 +234,7 @@ class SelectorGenerator:
 			strategies.append(
 				SelectorStrategy(
 					type='placeholder',
-					value=attrs['placeholder'],
+					value=_intern(attrs['placeholder']),
 					priority=4,
 					metadata={'tag': tag},
 				)
@@ -165,7 +245,7 @@ class SelectorGenerator:
 			strategies.append(
 				SelectorStrategy(
 					type='title',
-					value=attrs['title'],
+					value=_intern(attrs['title']),
 					priority=5,
 					metadata={'tag': tag},
 				)
@@ -176,7 +256,7 @@ class SelectorGenerator:
 			strategies.append(
 				SelectorStrategy(
 					type='alt_text',
-					value=attrs['alt'],
+					value=_intern(attrs['alt']),
 					priority=6,
 					metadata={'tag': tag},
 				)
@@ -279,8 +359,10 @@ class SelectorGenerator:
 						)
 					)
 
-		# Sort by priority (lower number = higher priority)
-		strategies.sort(key=lambda s: s.priority)
+		# Sort by priority (lower number = higher priority). Semantic strategies are appended in
+		# priority order, but optimized XPaths can rank ahead of them (e.g. id-based at priority 2)
+		if any(a.priority > b.priority for a, b in zip(strategies, strategies[1:])):
+			strategies.sort(key=attrgetter('priority'))
 
 		# Limit total number of strategies if configured
 		if self.max_total_strategies and len(strategies) > self.max_total_strategies:
@@ -304,37 +386,12 @@ class SelectorGenerator:
 		if 'role' in attrs:
 			return attrs['role']
 
-		# Infer from HTML tag
-		role_map = {
-			'button': 'button',
-			'a': 'link',
-			'input': 'textbox',
-			'textarea': 'textbox',
-			'select': 'combobox',
-			'h1': 'heading',
-			'h2': 'heading',
-			'h3': 'heading',
-			'h4': 'heading',
-			'h5': 'heading',
-			'h6': 'heading',
-			'img': 'img',
-			'table': 'table',
-			'ul': 'list',
-			'ol': 'list',
-			'nav': 'navigation',
-		}
-
 		# Special case for input types
 		if tag == 'input' and 'type' in attrs:
-			input_type = attrs['type'].lower()
-			if input_type == 'checkbox':
-				return 'checkbox'
-			elif input_type == 'radio':
-				return 'radio'
-			elif input_type == 'submit':
-				return 'button'
+			return _INPUT_ROLE.get(attrs['type'].lower(), 'textbox')
 
-		return role_map.get(tag)
+		# Infer from HTML tag
+		return _ROLE_MAP.get(tag)
 
 	def _generate_xpath(self, tag: str, text: str, attrs: Dict[str, Any]) -> Optional[str]:
 		"""
@@ -599,8 +656,11 @@ class SelectorGenerator:
 		Returns:
 		    List of strategy dictionaries
 		"""
-		strategies = self.generate_strategies(element_data)
-		return [s.to_dict() for s in strategies]
+		# Built inline rather than through to_dict; metadata is copied since the strategies are cached
+		return [
+			{'type': s.type, 'value': s.value, 'priority': s.priority, 'metadata': dict(s.metadata)}
+			for s in self.generate_strategies(element_data)
+		]
 
 	def get_summary(self, strategies: List[SelectorStrategy]) -> str:
 		"""
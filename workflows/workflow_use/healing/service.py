@@ -1,4 +1,3 @@
-import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,7 +10,7 @@ from browser_use.llm import SystemMessage, UserMessage
 from browser_use.llm.base import BaseChatModel, BaseMessage
 
 from workflow_use.builder.service import BuilderService
-from workflow_use.healing.deterministic_converter import DeterministicWorkflowConverter
+from workflow_use.healing.deterministic_converter import DeterministicWorkflowConverter, element_hash_hex
 from workflow_use.healing.selector_generator import SelectorGenerator
 from workflow_use.healing.validator import WorkflowValidator
 from workflow_use.healing.variable_extractor import VariableExtractor
@@ -197,8 +196,8 @@ class HealingService:
 				# Get tag_name from node_name (lowercased)
 				tag_name = element.node_name.lower() if hasattr(element, 'node_name') else ''
 
-				# hash element by hashing the node_name + element_hash
-				element_hash = hashlib.sha256(f'{tag_name}_{element.element_hash}'.encode()).hexdigest()[:10]
+				# hash element by hashing the node_name + element_hash (same helper as the deterministic converter)
+				element_hash = element_hash_hex(f'{tag_name}_{element.element_hash}')
 
 				if element_hash not in self.interacted_elements_hash_map:
 					self.interacted_elements_hash_map[element_hash] = element
@@ -366,40 +365,39 @@ class HealingService:
 			if history.model_output is None:
 				continue
 			for action in history.model_output.action:
-				action_dict = action.model_dump()
-				# Extract index from browser-use action format
-				for key, value in action_dict.items():
-					if isinstance(value, dict) and 'index' in value:
-						index = value['index']
-						if index in self.deterministic_converter.element_hash_map:
-							element_hash = self.deterministic_converter.element_hash_map[index]
-
-							# First try: Use captured element data (more reliable)
-							if index in captured_map:
-								# Create a mock DOMInteractedElement from captured data
-								captured_data = captured_map[index]
-
-								# Create a simple object with the needed attributes
-								class MockElement:
-									def __init__(self, data):
-										self.node_name = data.get('tag_name', '').upper()
-										self.css_selector = data.get('css_selector', '')
-										self.x_path = data.get('xpath', '')
-										self.xpath = data.get('xpath', '')  # Support both attribute names
-
-								mock_element = MockElement(captured_data)
-								self.interacted_elements_hash_map[element_hash] = mock_element
-								print(f'   📍 Populated selector for hash {element_hash} from captured data (index {index})')
-								print(f'      CSS: {mock_element.css_selector}')
-								print(f'      XPath: {mock_element.x_path}')
-								continue
-
-							# Fallback: Use history.state.interacted_element
-							for element in history.state.interacted_element:
-								if element and hasattr(element, 'highlight_index') and element.highlight_index == index:
-									self.interacted_elements_hash_map[element_hash] = element
-									print(f'   📍 Populated selector for hash {element_hash} from history (index {index})')
-									break
+				# Extract index from browser-use action format ({action_type: {params}}), dumping only the active action
+				_, action_params = self.deterministic_converter.parse_action(action)
+				index = action_params.get('index')
+				if index is None or index not in self.deterministic_converter.element_hash_map:
+					continue
+				element_hash = self.deterministic_converter.element_hash_map[index]
+
+				# First try: Use captured element data (more reliable)
+				if index in captured_map:
+					# Create a mock DOMInteractedElement from captured data
+					captured_data = captured_map[index]
+
+					# Create a simple object with the needed attributes
+					class MockElement:
+						def __init__(self, data):
+							self.node_name = data.get('tag_name', '').upper()
+							self.css_selector = data.get('css_selector', '')
+							self.x_path = data.get('xpath', '')
+							self.xpath = data.get('xpath', '')  # Support both attribute names
+
+					mock_element = MockElement(captured_data)
+					self.interacted_elements_hash_map[element_hash] = mock_element
+					print(f'   📍 Populated selector for hash {element_hash} from captured data (index {index})')
+					print(f'      CSS: {mock_element.css_selector}')
+					print(f'      XPath: {mock_element.x_path}')
+					continue
+
+				# Fallback: Use history.state.interacted_element
+				for element in history.state.interacted_element:
+					if element and hasattr(element, 'highlight_index') and element.highlight_index == index:
+						self.interacted_elements_hash_map[element_hash] = element
+						print(f'   📍 Populated selector for hash {element_hash} from history (index {index})')
+						break
 
 		# Create workflow definition dict
 		workflow_dict = self.deterministic_converter.create_workflow_definition(
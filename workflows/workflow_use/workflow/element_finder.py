@@ -8,15 +8,252 @@ Uses semantic strategies with XPath fallback.
 Leverages browser-use's existing semantic finding through the controller.
 """
 
+import functools
 import logging
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from workflow_use.workflow.error_reporter import StrategyAttempt
 
+try:
+	from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except ImportError:  # rapidfuzz is optional; fall back to difflib's SequenceMatcher
+	_rapidfuzz_ratio = None
+
 logger = logging.getLogger(__name__)
 
 
+def _get_attr(node: Any, attr: str) -> Any:
+	"""Read an attribute from a dict or object node, normalising missing/None values to ''."""
+	if isinstance(node, dict):
+		return node.get(attr) or ''
+	return getattr(node, attr, '') or ''
+
+
+@functools.lru_cache(maxsize=4096)
+def _fuzzy_ratio(target_lower: str, candidate_lower: str) -> float:
+	"""Similarity ratio of two lowercased strings, cached across strategies, pages and reruns."""
+	return SequenceMatcher(None, target_lower, candidate_lower).ratio()
+
+
+def _fuzzy_match(target: str, candidate: str, threshold: float) -> bool:
+	target = target.lower()
+	candidate = candidate.lower()
+
+	# Both scorers compute 2 * matches / (len_a + len_b), and matches can never exceed the shorter
+	# string, so pairs whose lengths are too far apart are rejected without scoring them
+	total = len(target) + len(candidate)
+	if total and 2 * min(len(target), len(candidate)) < threshold * total:
+		return False
+
+	if _rapidfuzz_ratio is not None:
+		# score_cutoff lets rapidfuzz bail out early and return 0 once the threshold is out of reach
+		cutoff = threshold * 100
+		return _rapidfuzz_ratio(target, candidate, score_cutoff=cutoff) >= cutoff
+	return _fuzzy_ratio(target, candidate) >= threshold
+
+
+class _NodeFields(NamedTuple):
+	"""Node attributes as the matchers compare them, read once per node per DOM state."""
+
+	text: str
+	aria_label: str
+	placeholder: str
+	title: str
+	alt: str
+	role: str  # Lowercased role, falling back to the tag name
+	mask: int  # _HAS_* bits of the non-empty fields above
+
+
+# Bits recording which fields of a node are non-empty
+_HAS_TEXT = 1
+_HAS_ARIA = 2
+_HAS_PLACEHOLDER = 4
+_HAS_TITLE = 8
+_HAS_ALT = 16
+_HAS_ROLE = 32
+
+# Field a strategy type compares against its (non-empty) value
+_STRATEGY_MASK = {
+	'text_exact': _HAS_TEXT,
+	'role_text': _HAS_TEXT,
+	'aria_label': _HAS_ARIA,
+	'placeholder': _HAS_PLACEHOLDER,
+	'title': _HAS_TITLE,
+	'alt_text': _HAS_ALT,
+	'text_fuzzy': _HAS_TEXT,
+}
+
+
+def _str_attr(node: Any, attr: str) -> str:
+	value = _get_attr(node, attr)
+	return value if isinstance(value, str) else ''
+
+
+def _node_fields(node: Any) -> _NodeFields:
+	"""Read and strip the matchable attributes of a dict or object node."""
+	text = _str_attr(node, 'text').strip()
+	aria_label = _str_attr(node, 'aria_label').strip()
+	placeholder = _str_attr(node, 'placeholder').strip()
+	title = _str_attr(node, 'title').strip()
+	alt = _str_attr(node, 'alt').strip()
+	role = (_str_attr(node, 'role') or _str_attr(node, 'tag_name')).lower()
+	mask = (
+		(_HAS_TEXT if text else 0)
+		| (_HAS_ARIA if aria_label else 0)
+		| (_HAS_PLACEHOLDER if placeholder else 0)
+		| (_HAS_TITLE if title else 0)
+		| (_HAS_ALT if alt else 0)
+		| (_HAS_ROLE if role else 0)
+	)
+	return _NodeFields(text, aria_label, placeholder, title, alt, role, mask)
+
+
+def _required_mask(strategy_type: str, value: str, metadata: Dict[str, Any]) -> int:
+	"""
+	Return the _HAS_* bits a node needs to possibly match a strategy.
+
+	An empty value can match an empty field, so it requires nothing; neither does fuzzy matching
+	with a non-positive threshold, which accepts any text.
+	"""
+	if not value or not isinstance(metadata, dict):
+		return 0
+	if strategy_type == 'text_fuzzy':
+		try:
+			if float(metadata.get('threshold', 0.8)) <= 0:
+				return 0
+		except (TypeError, ValueError):
+			return 0  # Invalid threshold; _compile_matcher turns the strategy into a non-match
+	mask = _STRATEGY_MASK.get(strategy_type, 0)
+	if strategy_type == 'role_text' and metadata.get('role'):
+		mask |= _HAS_ROLE
+	return mask
+
+
+# A strategy compiled against its value and metadata, called once per candidate node
+_NodeMatcher = Callable[[_NodeFields], bool]
+
+
+def _compile_text_exact(value: str, metadata: Dict[str, Any]) -> _NodeMatcher:
+	def match(fields: _NodeFields) -> bool:
+		return fields.text == value
+
+	return match
+
+
+def _compile_role_text(value: str, metadata: Dict[str, Any]) -> _NodeMatcher:
+	role = metadata.get('role', '').lower()
+
+	def match(fields: _NodeFields) -> bool:
+		return fields.role == role and fields.text == value
+
+	return match
+
+
+def _compile_text_fuzzy(value: str, metadata: Dict[str, Any]) -> _NodeMatcher:
+	value = value.lower()  # Fail at compile time, not per node, if value is not a string
+	threshold = float(metadata.get('threshold', 0.8))
+
+	def match(fields: _NodeFields) -> bool:
+		return _fuzzy_match(value, fields.text, threshold)
+
+	return match
+
+
+def _field_compiler(field: str) -> Callable[[str, Dict[str, Any]], _NodeMatcher]:
+	"""Build a compiler for strategies comparing one node field against their value."""
+	get_field = attrgetter(field)
+
+	def compile_field(value: str, metadata: Dict[str, Any]) -> _NodeMatcher:
+		def match(fields: _NodeFields) -> bool:
+			return get_field(fields) == value
+
+		return match
+
+	return compile_field
+
+
+def _never_matches(fields: _NodeFields) -> bool:
+	return False
+
+
+def _compile_matcher(strategy_type: str, value: str, metadata: Dict[str, Any]) -> _NodeMatcher:
+	"""
+	Bind a semantic strategy's value and metadata into a predicate over node fields.
+
+	Metadata is read and validated here once, so the per-node predicate is a plain comparison.
+	Unknown types and invalid strategies compile to a predicate that never matches.
+	"""
+	compile_matcher = _MATCHERS.get(strategy_type)
+	if compile_matcher is None:
+		# XPath and CSS strategies are handled separately in find_element_with_strategies
+		# They cannot be matched against browser-use's node representation
+		return _never_matches
+
+	try:
+		return compile_matcher(value, metadata)
+	except Exception as e:
+		logger.debug('Error matching strategy: %s', e)
+		return _never_matches
+
+
+# _NodeFields fields with an exact-match inverted index, and the field each strategy type looks up.
+# role_text narrows its candidates by text and then checks the role; text_fuzzy has no index.
+_INDEXED_FIELDS = ('text', 'aria_label', 'placeholder', 'title', 'alt')
+_STRATEGY_INDEX_FIELD = {
+	'text_exact': 'text',
+	'role_text': 'text',
+	'aria_label': 'aria_label',
+	'placeholder': 'placeholder',
+	'title': 'title',
+	'alt_text': 'alt',
+}
+
+
+def _strategy_attempt(strategy: Dict[str, Any], success: bool, error_message: Optional[str] = None) -> StrategyAttempt:
+	"""Build the StrategyAttempt record for a strategy dictionary."""
+	return StrategyAttempt(
+		strategy_type=strategy.get('type'),
+		strategy_value=strategy.get('value', ''),
+		priority=strategy.get('priority', 999),
+		success=success,
+		error_message=error_message,
+		metadata=strategy.get('metadata', {}),
+	)
+
+
+def _strategies_signature(strategies: List[Dict[str, Any]]) -> Optional[tuple]:
+	"""
+	Hashable key for a run of semantic strategies, or None if it cannot be built.
+
+	Matching only reads the type, value and the role/threshold metadata, and visibility is fixed
+	within one selector map, so equal keys give equal results on the same map.
+	"""
+	try:
+		key = tuple(
+			(strategy.get('type'), strategy.get('value', ''), metadata.get('role'), metadata.get('threshold'))
+			for strategy in strategies
+			for metadata in (strategy.get('metadata', {}),)
+		)
+		hash(key)
+		return key
+	except (AttributeError, TypeError):
+		return None
+
+
+# Semantic strategy type -> compiler(value, metadata) returning a _NodeMatcher
+_MATCHERS: Dict[str, Callable[[str, Dict[str, Any]], _NodeMatcher]] = {
+	'text_exact': _compile_text_exact,
+	'role_text': _compile_role_text,
+	'aria_label': _field_compiler('aria_label'),
+	'placeholder': _field_compiler('placeholder'),
+	'title': _field_compiler('title'),
+	'alt_text': _field_compiler('alt'),
+	'text_fuzzy': _compile_text_fuzzy,
+}
+
+
 class ElementFinder:
 	"""
 	Find elements using multiple semantic fallback strategies.
@@ -26,6 +263,16 @@ class ElementFinder:
 	provide a faster path when we have semantic hints from workflow recording.
 	"""
 
+	def __init__(self):
+		# Node fields, inverted index and page mask for the last selector map seen (see _get_selector_state)
+		self._indexed_map: Optional[Dict[Any, Any]] = None
+		self._indexed_size = 0
+		self._node_fields: Dict[Any, _NodeFields] = {}
+		self._selector_index: Dict[str, Dict[str, List[Any]]] = {}
+		self._page_mask = 0
+		# Results of _find_with_semantic_strategies for that map, keyed by strategy signature
+		self._match_cache: Dict[tuple, Optional[tuple[int, int, Any]]] = {}
+
 	async def find_element_with_strategies(
 		self, strategies: List[Dict[str, Any]], browser_session: Any, target_text: Optional[str] = None
 	) -> Tuple[Optional[tuple[int, Dict[str, Any]]], List[StrategyAttempt]]:
@@ -61,7 +308,7 @@ class ElementFinder:
 				logger.warning('      ⚠️  No page available')
 				return None, strategy_attempts
 		except Exception as e:
-			logger.warning(f'      ⚠️  Failed to get current page: {e}')
+			logger.warning('      ⚠️  Failed to get current page: %s', e)
 			return None, strategy_attempts
 
 		# Get selector map for semantic strategies
@@ -69,22 +316,56 @@ class ElementFinder:
 		try:
 			selector_map = await browser_session.get_selector_map()
 			if selector_map:
-				logger.debug(f'      📋 Retrieved selector map with {len(selector_map)} elements')
+				logger.debug('      📋 Retrieved selector map with %s elements', len(selector_map))
 		except Exception as e:
-			logger.debug(f'      ⚠️  Could not get selector map: {e}')
+			logger.debug('      ⚠️  Could not get selector map: %s', e)
+
+		# Sort by priority (should already be sorted, so only sort when an out-of-order pair exists)
+		priorities = [strategy.get('priority', 999) for strategy in strategies]
+		if all(a <= b for a, b in zip(priorities, priorities[1:])):
+			sorted_strategies = strategies
+		else:
+			sorted_strategies = sorted(strategies, key=lambda s: s.get('priority', 999))
+		total = len(sorted_strategies)
+
+		i = 0
+		while i < total:
+			strategy = sorted_strategies[i]
+			strategy_type = strategy.get('type')
 
-		# Sort by priority (should already be sorted, but ensure it)
-		sorted_strategies = sorted(strategies, key=lambda s: s.get('priority', 999))
+			# Consecutive semantic strategies are matched together in one pass over the selector map
+			if selector_map and strategy_type in _MATCHERS:
+				run_end = i + 1
+				while run_end < total and sorted_strategies[run_end].get('type') in _MATCHERS:
+					run_end += 1
+				run = sorted_strategies[i:run_end]
+
+				match = self._find_with_semantic_strategies(run, selector_map, target_text)
+				matched_at = match[0] if match else len(run)
+
+				error_msg = 'No matching element found in DOM'
+				for position, failed in enumerate(run[:matched_at], i + 1):
+					logger.info('      🔍 Strategy %s/%s: %s', position, total, failed.get('type'))
+					logger.debug('         ⏭️  %s', error_msg)
+					strategy_attempts.append(_strategy_attempt(failed, success=False, error_message=error_msg))
+
+				if match:
+					_, element_index, _ = match
+					winner = run[matched_at]
+					logger.info('      🔍 Strategy %s/%s: %s', i + matched_at + 1, total, winner.get('type'))
+					logger.info('         ✅ Found element with %s', winner.get('type'))
+					strategy_attempts.append(_strategy_attempt(winner, success=True))
+					return (element_index, winner), strategy_attempts
+
+				i = run_end
+				continue
 
-		for i, strategy in enumerate(sorted_strategies, 1):
-			strategy_type = strategy.get('type')
 			strategy_value = strategy.get('value', '')
-			priority = strategy.get('priority', 999)
-			metadata = strategy.get('metadata', {})
 			error_msg = None
+			i += 1
 
 			try:
-				logger.info(f'      🔍 Strategy {i}/{len(sorted_strategies)}: {strategy_type}')
+				logger.info('      🔍 Strategy %s/%s: %s', i, total, strategy_type)
 
 				# Try XPath strategies via Playwright
 				if strategy_type == 'xpath':
@@ -92,53 +373,13 @@ class ElementFinder:
 					if result:
 						xpath_string, xpath_used = result
 						logger.info('         ✅ Found element with XPath')
-						# Record successful attempt
-						strategy_attempts.append(
-							StrategyAttempt(
-								strategy_type=strategy_type,
-								strategy_value=strategy_value,
-								priority=priority,
-								success=True,
-								metadata=metadata,
-							)
-						)
+						strategy_attempts.append(_strategy_attempt(strategy, success=True))
 						# Return XPath string for semantic_executor.py to use in JavaScript click
 						# Note: This differs from semantic strategies which return element_index for service.py
 						return (xpath_string, strategy), strategy_attempts
 					else:
 						error_msg = 'XPath query returned no results'
-						logger.debug(f'         ⏭️  {error_msg}')
-
-				# Try semantic strategies using selector map
-				elif selector_map and strategy_type in [
-					'text_exact',
-					'role_text',
-					'aria_label',
-					'placeholder',
-					'title',
-					'alt_text',
-					'text_fuzzy',
-				]:
-					result = await self._find_with_semantic_strategy(
-						strategy_type, strategy_value, metadata, selector_map, target_text
-					)
-					if result:
-						element_index, matched_element = result
-						logger.info(f'         ✅ Found element with {strategy_type}')
-						# Record successful attempt
-						strategy_attempts.append(
-							StrategyAttempt(
-								strategy_type=strategy_type,
-								strategy_value=strategy_value,
-								priority=priority,
-								success=True,
-								metadata=metadata,
-							)
-						)
-						return (element_index, strategy), strategy_attempts
-					else:
-						error_msg = 'No matching element found in DOM'
-						logger.debug(f'         ⏭️  {error_msg}')
+						logger.debug('         ⏭️  %s', error_msg)
 
 				else:
 					# Strategy type not supported or no selector map available
@@ -146,72 +387,214 @@ class ElementFinder:
 						error_msg = 'Selector map not available for semantic strategy'
 					else:
 						error_msg = f'Strategy type "{strategy_type}" not supported'
-					logger.debug(f'         ⏭️  {error_msg}')
+					logger.debug('         ⏭️  %s', error_msg)
 
 			except Exception as e:
 				error_msg = str(e)
-				logger.debug(f'         ❌ Error with {strategy_type}: {e}')
+				logger.debug('         ❌ Error with %s: %s', strategy_type, e)
 
 			# Record failed attempt
-			strategy_attempts.append(
-				StrategyAttempt(
-					strategy_type=strategy_type,
-					strategy_value=strategy_value,
-					priority=priority,
-					success=False,
-					error_message=error_msg,
-					metadata=metadata,
-				)
-			)
+			strategy_attempts.append(_strategy_attempt(strategy, success=False, error_message=error_msg))
 
 		# All strategies failed
-		logger.warning(f'      ❌ All {len(sorted_strategies)} strategies failed')
+		logger.warning('      ❌ All %s strategies failed', total)
 		return None, strategy_attempts
 
-	async def _find_with_semantic_strategy(
+	def _get_selector_state(
+		self, selector_map: Dict[Any, Any]
+	) -> Tuple[Dict[Any, _NodeFields], Dict[str, Dict[str, List[Any]]], int]:
+		"""
+		Return the per-node fields, inverted index and page mask for selector_map, rebuilding them only when the map changes.
+
+		browser-use replaces its cached selector map on every DOM refresh and only ever clears the
+		old one in place, so the map's identity plus its size identifies a DOM state. The map object
+		is kept referenced so its id cannot be reused while it is cached.
+
+		Args:
+		    selector_map: Browser-use's selector map (dict of index -> element)
+
+		Returns:
+		    Tuple of:
+		        - Dict of selector index -> _NodeFields
+		        - Dict of node field -> {stripped value: [selector indices in map order]}
+		        - OR of every node's _HAS_* mask, i.e. the fields present anywhere on the page
+		"""
+		if self._indexed_map is selector_map and self._indexed_size == len(selector_map):
+			return self._node_fields, self._selector_index, self._page_mask
+
+		node_fields: Dict[Any, _NodeFields] = {}
+		index: Dict[str, Dict[str, List[Any]]] = {field: {} for field in _INDEXED_FIELDS}
+		page_mask = 0
+		for element_index, node in selector_map.items():
+			fields = node_fields[element_index] = _node_fields(node)
+			page_mask |= fields.mask
+			for field, values in index.items():
+				values.setdefault(getattr(fields, field), []).append(element_index)
+
+		self._indexed_map = selector_map
+		self._indexed_size = len(selector_map)
+		self._node_fields = node_fields
+		self._selector_index = index
+		self._page_mask = page_mask
+		self._match_cache = {}
+		return node_fields, index, page_mask
+
+	def _find_with_semantic_strategies(
 		self,
-		strategy_type: str,
-		strategy_value: str,
-		metadata: Dict[str, Any],
+		strategies: List[Dict[str, Any]],
 		selector_map: Dict[str, Any],
 		target_text: Optional[str] = None,
-	) -> Optional[tuple[int, Dict[str, Any]]]:
+	) -> Optional[tuple[int, int, Any]]:
 		"""
-		Find element using semantic strategy in browser-use's selector map.
+		Find the best element for a run of semantic strategies.
+
+		The result is the same as trying the strategies one at a time: the earliest strategy that
+		matches a visible node wins, and among nodes matching that strategy the first one in selector
+		map order is returned. Exact-match strategies look their candidates up in the inverted index;
+		consecutive strategies without an index (fuzzy text) share a single pass over the map. Results
+		are cached until the selector map changes, since re-running a step on an unchanged page
+		repeats the same lookup.
 
 		Args:
-		    strategy_type: Type of semantic strategy (text_exact, role_text, etc.)
-		    strategy_value: Value to match
-		    metadata: Additional matching metadata
+		    strategies: Semantic strategy dictionaries, already sorted by priority
 		    selector_map: Browser-use's selector map (dict of index -> element)
 		    target_text: Optional target text for validation
 
 		Returns:
-		    Tuple of (element_index, element_data) if found, None otherwise
+		    Tuple of (position in strategies, element_index, element) if found, None otherwise
 		"""
 		try:
-			# Iterate through selector map to find matching element
-			for index, element in selector_map.items():
-				# Handle both dict and object formats
-				if isinstance(element, dict):
-					node = element
-				else:
-					# Convert object to dict-like access
-					node = element
+			node_fields, selector_index, page_mask = self._get_selector_state(selector_map)
 
-				# Check if element matches the strategy
-				if await self._matches_strategy(node, strategy_type, strategy_value, metadata):
-					# Validate element exists and is visible
-					if await self._validate_element_in_map(index, node, target_text):
-						return (int(index), node)
+			key = _strategies_signature(strategies)
+			if key is not None and key in self._match_cache:
+				return self._match_cache[key]
 
-			return None
+			match = self._search_semantic_strategies(
+				strategies, selector_map, node_fields, selector_index, page_mask, target_text
+			)
+			if key is not None:
+				self._match_cache[key] = match
+			return match
 
 		except Exception as e:
-			logger.debug(f'Error finding element with semantic strategy: {e}')
+			logger.debug('Error finding element with semantic strategy: %s', e)
 			return None
 
-	async def _validate_element_in_map(self, index: int, node: Any, target_text: Optional[str] = None) -> bool:
+	def _search_semantic_strategies(
+		self,
+		strategies: List[Dict[str, Any]],
+		selector_map: Dict[str, Any],
+		node_fields: Dict[Any, _NodeFields],
+		selector_index: Dict[str, Dict[str, List[Any]]],
+		page_mask: int,
+		target_text: Optional[str],
+	) -> Optional[tuple[int, int, Any]]:
+		"""Uncached body of _find_with_semantic_strategies, given the state from _get_selector_state."""
+		validated: Dict[Any, bool] = {}
+		position = 0
+		while position < len(strategies):
+			strategy = strategies[position]
+			strategy_type = strategy.get('type')
+
+			# Skip strategies comparing a field no node on the page has (e.g. text strategies on a
+			# page without text) without looking up or scanning anything
+			mask = _required_mask(strategy_type, strategy.get('value', ''), strategy.get('metadata', {}))
+			if page_mask & mask != mask:
+				position += 1
+				continue
+
+			field = _STRATEGY_INDEX_FIELD.get(strategy_type)
+
+			if field is None:
+				scan_end = position + 1
+				while scan_end < len(strategies) and strategies[scan_end].get('type') not in _STRATEGY_INDEX_FIELD:
+					scan_end += 1
+				match = self._scan_selector_map(strategies[position:scan_end], selector_map, node_fields, target_text, validated)
+				if match:
+					offset, element_index, node = match
+					return (position + offset, element_index, node)
+				position = scan_end
+				continue
+
+			value = strategy.get('value', '')
+			matcher = _compile_matcher(strategy_type, value, strategy.get('metadata', {}))
+			try:
+				candidates = selector_index[field].get(value, ())
+			except TypeError:
+				# Unhashable value (e.g. a list): it can't equal any indexed string, so it's a miss
+				candidates = ()
+			for element_index in candidates:
+				if not matcher(node_fields[element_index]):
+					continue
+				node = selector_map[element_index]
+				if element_index not in validated:
+					validated[element_index] = self._validate_element_in_map(element_index, node, target_text)
+				if validated[element_index]:
+					return (position, int(element_index), node)
+			position += 1
+
+		return None
+
+	def _scan_selector_map(
+		self,
+		strategies: List[Dict[str, Any]],
+		selector_map: Dict[str, Any],
+		node_fields: Dict[Any, _NodeFields],
+		target_text: Optional[str],
+		validated: Dict[Any, bool],
+	) -> Optional[tuple[int, int, Any]]:
+		"""
+		Match strategies against every node in a single pass over the selector map.
+
+		Each node is checked against the strategies in order, so the earliest matching strategy wins
+		and the scan stops once the first strategy has matched.
+
+		Args:
+		    strategies: Semantic strategy dictionaries, already sorted by priority
+		    selector_map: Browser-use's selector map (dict of index -> element)
+		    node_fields: Matchable fields of each node, from _get_selector_state
+		    target_text: Optional target text for validation
+		    validated: Visibility results already computed for this lookup, keyed by element index
+
+		Returns:
+		    Tuple of (position in strategies, element_index, element) if found, None otherwise
+		"""
+		best = None
+		best_position = len(strategies)
+
+		# Read the strategy fields and compile the matchers once, not once per node
+		types = tuple(strategy.get('type') for strategy in strategies)
+		values = tuple(strategy.get('value', '') for strategy in strategies)
+		metadatas = tuple(strategy.get('metadata', {}) for strategy in strategies)
+		matchers = tuple(map(_compile_matcher, types, values, metadatas))
+		masks = tuple(map(_required_mask, types, values, metadatas))
+
+		for index, node in selector_map.items():
+			fields = node_fields[index]
+			node_mask = fields.mask
+			# zip with range() stops at the best strategy found so far
+			for position, matcher, mask in zip(range(best_position), matchers, masks):
+				# Skip strategies whose field is empty on this node before running the matcher
+				if node_mask & mask != mask or not matcher(fields):
+					continue
+
+				# Visibility does not depend on the strategy, so validate each node at most once
+				if index not in validated:
+					validated[index] = self._validate_element_in_map(index, node, target_text)
+				if not validated[index]:
+					break
+
+				best = (position, int(index), node)
+				best_position = position
+				break
+
+			if best_position == 0:
+				break
+
+		return best
+
+	def _validate_element_in_map(self, index: int, node: Any, target_text: Optional[str] = None) -> bool:
 		"""
 		Validate that element in selector map is visible and optionally matches target_text.
 
@@ -223,21 +606,27 @@ class ElementFinder:
 		Returns:
 		    True if element is valid and visible
 		"""
-		try:
-			# Helper to get attribute from dict or object
-			def get_attr(obj, attr, default=''):
-				if isinstance(obj, dict):
-					return obj.get(attr, default)
-				return getattr(obj, attr, default)
 
+		# Helper to get attribute from dict or object
+		def get_attr(obj, attr, default=''):
+			if isinstance(obj, dict):
+				return obj.get(attr, default)
+			return getattr(obj, attr, default)
+
+		try:
 			# Check if node is visible - this is a hard requirement
 			is_visible = get_attr(node, 'is_visible', True)
-			if not is_visible:
-				logger.debug(f'Element at index {index} is not visible')
-				return False
+		except Exception as e:
+			logger.debug('Error validating element at index %s: %s', index, e)
+			return False
+		if not is_visible:
+			logger.debug('Element at index %s is not visible', index)
+			return False
 
-			# If target_text is provided, validate it (advisory only)
-			if target_text:
+		# If target_text is provided, validate it (advisory only). The result is only logged,
+		# so skip collecting the text sources unless debug logging is on; it never affects validity
+		if target_text and logger.isEnabledFor(logging.DEBUG):
+			try:
 				target_lower = target_text.lower().strip()
 
 				# Collect all text sources from the element
@@ -278,85 +667,14 @@ class ElementFinder:
 
 				if not found_match:
 					logger.debug(
-						f'⚠️ Target text "{target_text}" not found in element at index {index}, but proceeding with selector.'
+						'⚠️ Target text "%s" not found in element at index %s, but proceeding with selector.', target_text, index
 					)
 				else:
-					logger.debug(f'✓ Target text "{target_text}" validated in element at index {index}')
-
-			return True
-
-		except Exception as e:
-			logger.debug(f'Error validating element at index {index}: {e}')
-			return False
-
-	async def _matches_strategy(self, node: Any, strategy_type: str, value: str, metadata: Dict[str, Any]) -> bool:
-		"""
-		Check if a DOM node matches a semantic strategy.
-
-		Args:
-		    node: EnhancedDOMTreeNode from browser-use (dict or object)
-		    strategy_type: Type of strategy (text_exact, role_text, etc.)
-		    value: Value to match
-		    metadata: Additional matching metadata
-
-		Returns:
-		    True if node matches the strategy
-		"""
-		try:
-			# Helper to get attribute from dict or object
-			def get_attr(obj, attr, default=''):
-				if isinstance(obj, dict):
-					return obj.get(attr, default)
-				return getattr(obj, attr, default)
-
-			# Semantic Strategy 1: Exact text match
-			if strategy_type == 'text_exact':
-				node_text = get_attr(node, 'text', '') or ''
-				return node_text.strip() == value
-
-			# Semantic Strategy 2: Role + text
-			elif strategy_type == 'role_text':
-				expected_role = metadata.get('role', '').lower()
-				node_role = get_attr(node, 'role', '') or get_attr(node, 'tag_name', '')
-				node_role = node_role.lower() if node_role else ''
-				node_text = get_attr(node, 'text', '') or ''
-
-				return node_role == expected_role and node_text.strip() == value
-
-			# Semantic Strategy 3: ARIA label
-			elif strategy_type == 'aria_label':
-				aria_label = get_attr(node, 'aria_label', '') or ''
-				return aria_label.strip() == value
-
-			# Semantic Strategy 4: Placeholder
-			elif strategy_type == 'placeholder':
-				placeholder = get_attr(node, 'placeholder', '') or ''
-				return placeholder.strip() == value
-
-			# Semantic Strategy 5: Title attribute
-			elif strategy_type == 'title':
-				title = get_attr(node, 'title', '') or ''
-				return title.strip() == value
-
-			# Semantic Strategy 6: Alt text (images)
-			elif strategy_type == 'alt_text':
-				alt = get_attr(node, 'alt', '') or ''
-				return alt.strip() == value
-
-			# Semantic Strategy 7: Fuzzy text match
-			elif strategy_type == 'text_fuzzy':
-				threshold = metadata.get('threshold', 0.8)
-				node_text = get_attr(node, 'text', '') or ''
-				return self._fuzzy_match(value, node_text.strip(), threshold)
-
-			# Note: XPath and CSS strategies are handled separately in find_element_with_strategies
-			# They cannot be matched against browser-use's node representation
-
-		except Exception as e:
-			logger.debug(f'Error matching strategy: {e}')
-			return False
+					logger.debug('✓ Target text "%s" validated in element at index %s', target_text, index)
+			except Exception as e:
+				logger.debug('Error checking target text for element at index %s: %s', index, e)
 
-		return False
+		return True
 
 	async def _validate_element_exists(
 		self, index: int, node: Any, browser_session: Any, target_text: Optional[str] = None
@@ -378,7 +696,7 @@ class ElementFinder:
 			# Check if node is visible - this is a hard requirement
 			is_visible = getattr(node, 'is_visible', True)
 			if not is_visible:
-				logger.debug(f'Element at index {index} is not visible')
+				logger.debug('Element at index %s is not visible', index)
 				return False
 
 			# If target_text is provided, validate it exists in the element's text sources
@@ -427,16 +745,19 @@ class ElementFinder:
 					# Don't fail - just log a warning
 					# The XPath/CSS selector is more authoritative than target_text hint
 					logger.debug(
-						f'⚠️ Target text "{target_text}" not found in element at index {index}, but proceeding with selector. '
-						f'Available text sources: {text_sources}'
+						'⚠️ Target text "%s" not found in element at index %s, but proceeding with selector. '
+						'Available text sources: %s',
+						target_text,
+						index,
+						text_sources,
 					)
 				else:
-					logger.debug(f'✓ Target text "{target_text}" validated in element at index {index}')
+					logger.debug('✓ Target text "%s" validated in element at index %s', target_text, index)
 
 			return True
 
 		except Exception as e:
-			logger.debug(f'Error validating element at index {index}: {e}')
+			logger.debug('Error validating element at index %s: %s', index, e)
 			return False
 
 	async def _find_with_xpath(
@@ -460,9 +781,9 @@ class ElementFinder:
 			normalized_xpath = xpath
 			if xpath and not xpath.startswith('/') and not xpath.startswith('('):
 				normalized_xpath = '/' + xpath
-				logger.info(f'         🔧 Normalized XPath to: {normalized_xpath}')
+				logger.info('         🔧 Normalized XPath to: %s', normalized_xpath)
 
-			logger.info(f'         🔎 Executing XPath: {normalized_xpath}')
+			logger.info('         🔎 Executing XPath: %s', normalized_xpath)
 
 			# Execute XPath query via JavaScript to find element
 			# Escape the XPath for safe JavaScript string usage
@@ -508,7 +829,7 @@ class ElementFinder:
 				return None
 
 			if isinstance(result, dict) and result.get('error'):
-				logger.warning(f'         ❌ XPath evaluation error: {result["error"]}')
+				logger.warning('         ❌ XPath evaluation error: %s', result['error'])
 				return None
 
 			if not isinstance(result, dict) or not result.get('found'):
@@ -519,12 +840,12 @@ class ElementFinder:
 				logger.info('         ⚠️  Element found but not visible')
 				return None
 
-			logger.info(f'         ✅ Found visible element: <{result["tag"]}>')
+			logger.info('         ✅ Found visible element: <%s>', result['tag'])
 			# Return the xpath itself since we'll execute click via JavaScript
 			return (normalized_xpath, normalized_xpath)
 
 		except Exception as e:
-			logger.warning(f'         ❌ Error executing XPath: {e}')
+			logger.warning('         ❌ Error executing XPath: %s', e)
 			return None
 
 	def _xpath_node_matches(self, node: Any, element_data: Dict[str, Any]) -> bool:
@@ -590,7 +911,7 @@ class ElementFinder:
 			return matches >= 2 or (matches > 0 and checks > 0 and matches / checks >= 0.7)
 
 		except Exception as e:
-			logger.debug(f'Error matching xpath node: {e}')
+			logger.debug('Error matching xpath node: %s', e)
 			return False
 
 	def _fuzzy_match(self, target: str, candidate: str, threshold: float = 0.8) -> bool:
@@ -605,5 +926,4 @@ class ElementFinder:
 		Returns:
 		    True if similarity >= threshold
 		"""
-		ratio = SequenceMatcher(None, target.lower(), candidate.lower()).ratio()
-		return ratio >= threshold
+		return _fuzzy_match(target, candidate, threshold)
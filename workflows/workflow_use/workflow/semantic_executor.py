@@ -55,6 +55,7 @@ class SemanticWorkflowExecutor:
 		self.current_step_index = 0
 		self.enable_step_verification = enable_step_verification
 		self.step_verifier = StepVerifier(llm=page_extraction_llm) if enable_step_verification else None
+		self._element_finder = None  # Created on first use by execute_click_step
 
 	async def _get_elements_by_selector(self, selector: str):
 		"""Helper to get elements by CSS selector (CDP replacement for page.locator).
@@ -756,13 +757,15 @@ class SemanticWorkflowExecutor:
 		if hasattr(step, 'selectorStrategies') and step.selectorStrategies:
 			logger.info(f'🎯 Using explicit selectorStrategies from workflow ({len(step.selectorStrategies)} strategies)')
 
-			# Import ElementFinder here to avoid circular imports
-			from workflow_use.workflow.element_finder import ElementFinder
+			# Reuse one finder so steps on an unchanged page share its per-selector-map caches
+			if self._element_finder is None:
+				# Import ElementFinder here to avoid circular imports
+				from workflow_use.workflow.element_finder import ElementFinder
 
-			element_finder = ElementFinder()
+				self._element_finder = ElementFinder()
 
 			target_text = step.target_text if hasattr(step, 'target_text') else None
-			result, strategy_attempts = await element_finder.find_element_with_strategies(
+			result, strategy_attempts = await self._element_finder.find_element_with_strategies(
 				step.selectorStrategies, self.browser, target_text
 			)
 